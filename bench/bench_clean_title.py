@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Checks clean_title against the original per-character implementation, then
+times both over a corpus of emoji-laden titles (cold, and with repeats as on
+redraws).
+
+    python bench/bench_clean_title.py [titles]
+"""
+import os
+import random
+import sys
+import time
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench.corpus import random_title, EMOJI
+from src.utils import clean_title
+
+def reference_clean_title(text):
+    """clean_title as it was before the fast path."""
+    if not text: return ""
+    text = unicodedata.normalize('NFKC', text)
+    cleaned = []
+    for char in text:
+        if ord(char) > 0xFFFF: continue
+        category = unicodedata.category(char)
+        if category.startswith(('C', 'S')):
+            if char in "$-+/%": cleaned.append(char)
+            else: cleaned.append(" ")
+        else:
+            cleaned.append(char)
+    text = "".join(cleaned)
+    return " ".join(text.split())
+
+EDGE_CASES = [
+    None, "", " ", "\t\n", "plain ascii title", "  padded   title  ", "$5 vs 10% +/- 3",
+    "a<b>c=d^e`f|g~h", "ctrl\x00\x07\x1f\x7fchars", "ﬁ ligature ＦＵＬＬＷＩＤＴＨ ①", "Ⅻ ㎏ ½",
+    "Café naïve résumé", "Ελληνικά русский 日本語 한국어 العربية", "\u200bzero\u200dwidth\ufeff",
+    "soft\u00adhyphen", "nbsp\u00a0and\u2003em space", "©®™ ✓✗ ♥", "👨‍💻 coding 🇸🇪", "\ud800 lone surrogate",
+    "𝐁𝐨𝐥𝐝 𝓈𝒸𝓇𝒾𝓅𝓉", "é combining", "trailing emoji 🔥🔥🔥",
+]
+
+def check(corpus):
+    cases = EDGE_CASES + corpus + [chr(code) for code in range(0x110000)] + [f"a{chr(code)}b" for code in range(0x3000)]
+    bad = [text for text in cases if clean_title(text) != reference_clean_title(text)]
+    assert not bad, f"{len(bad)} mismatches, e.g. {bad[:3]!r}"
+    return len(cases)
+
+def timed(fn, titles, rounds=5):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for title in titles: fn(title)
+    return (time.perf_counter() - start) / rounds
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rng = random.Random(1)
+    corpus = [random_title(rng) for _ in range(count)]
+    corpus += [f"Channel {i} {rng.choice(EMOJI)} & Friends" for i in range(count // 10)]
+    ascii_titles = [t for t in corpus if t.isascii()]
+
+    print(f"Checked {check(corpus)} strings against the reference implementation")
+    print(f"Corpus: {len(corpus)} titles, {len(ascii_titles)} pure ASCII")
+
+    ref_time = timed(reference_clean_title, corpus)
+    clean_title.cache_clear()
+    cold_time = timed(lambda t: (clean_title.cache_clear(), clean_title(t)), corpus)
+    warm_time = timed(clean_title, corpus)
+    print(f"reference:      {ref_time * 1000:8.2f} ms")
+    print(f"fast (no memo): {cold_time * 1000:8.2f} ms  ({ref_time / cold_time:.1f}x)")
+    print(f"fast (memo):    {warm_time * 1000:8.2f} ms  ({ref_time / warm_time:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Ingests a full refresh's worth of entries and seen-marks, statement-at-a-time
+(rollback journal, one commit per write) vs. WAL + DatabaseManager.transaction().
+
+    python bench/bench_db_writes.py [channels]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.database import DatabaseManager
+
+UPSERT = '''INSERT INTO videos (video_id, title, channel, url, duration, is_shorts, published_date, feed_url)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(video_id) DO UPDATE SET title = excluded.title, published_date = excluded.published_date'''
+SEEN = "INSERT OR IGNORE INTO seen_videos (video_id, title, seen_date) VALUES (?, ?, ?)"
+
+def workload(channels, per_channel=15):
+    now = datetime.now().isoformat()
+    entries = [(f"{ch:05d}{i:06d}", f"Video {i}", f"Channel {ch}", f"https://youtu.be/{ch}{i}", None, False, now, f"feed{ch}")
+               for ch in range(channels) for i in range(per_channel)]
+    seen = [(e[0], e[1], now) for e in entries[::3]]
+    return entries, seen
+
+def run(db, entries, seen, batched):
+    db.connect()
+    start_commits = db.commits
+    start = time.perf_counter()
+    if batched:
+        with db.transaction():
+            db.executemany(UPSERT, entries)
+            db.executemany(SEEN, seen)
+    else:
+        for row in entries: db.execute(UPSERT, row)
+        for row in seen: db.execute(SEEN, row)
+    return time.perf_counter() - start, db.commits - start_commits
+
+def main():
+    channels = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    entries, seen = workload(channels)
+    print(f"{len(entries)} entries + {len(seen)} seen-marks")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, wal, batched in (("per-statement", False, False), ("WAL + transaction", True, True)):
+            db = DatabaseManager(os.path.join(tmp, f"{wal}.db"), wal=wal)
+            elapsed, commits = run(db, entries, seen, batched)
+            db.close()
+            print(f"{name:<18} {elapsed * 1000:9.1f} ms  {commits:6d} commits")
+
+if __name__ == "__main__":
+    main()
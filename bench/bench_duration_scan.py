@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Bytes and time per duration lookup: full-page download vs. the streaming scan.
+
+Serves a canned ~1 MB watch page from a local aiohttp server.
+
+    python bench/bench_duration_scan.py [lookups]
+"""
+import asyncio
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import aiohttp
+from aiohttp import web
+from src.database import DatabaseManager
+from src.durations import DurationResolver
+
+PORT = 8791
+
+def watch_page():
+    """Roughly the layout of a YouTube watch page: inline CSS/JS, the player
+    response (with lengthSeconds) near the top of <body>, then a long tail
+    of initial data and microformat meta tags."""
+    head = "<html><head>" + "<style>" + ".yt-x{color:#fff;}" * 4000 + "</style>"
+    head += "<script>var ytcfg={" + '"k":"v",' * 5000 + "};</script></head><body>"
+    player = '<script>var ytInitialPlayerResponse = {"videoDetails":{"videoId":"abc","title":"t","lengthSeconds":"754","channelId":"UC"}};</script>'
+    tail = "<script>var ytInitialData = {" + '"contents":{"a":1},' * 50000 + "};</script>"
+    meta = '<div id="watch7-content"><meta itemprop="duration" content="PT12M34S"></div>'
+    return (head + player + tail + meta + "</body></html>").encode()
+
+PAGE = watch_page()
+
+async def handler(request):
+    return web.Response(body=PAGE, content_type="text/html")
+
+async def full_download(session, url):
+    async with session.get(url) as resp:
+        html = await resp.text()
+    re.search(r'itemprop="duration" content="PT(\d+H)?(\d+M)?(\d+S)?"', html)
+    return len(html.encode())
+
+async def main():
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    app = web.Application()
+    app.router.add_get("/watch", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", PORT).start()
+    urls = [f"http://127.0.0.1:{PORT}/watch?v={i}" for i in range(lookups)]
+
+    start = time.perf_counter()
+    async with aiohttp.ClientSession() as session:
+        full_bytes = sum([await full_download(session, url) for url in urls])
+    full_time = time.perf_counter() - start
+
+    db = DatabaseManager(":memory:")
+    resolver = DurationResolver(db, "bench")
+    start = time.perf_counter()
+    durations = [await resolver._scrape(url) for url in urls]
+    scan_time = time.perf_counter() - start
+    await resolver.close()
+    await runner.cleanup()
+    assert durations == ["12:34"] * lookups, durations[:3]
+
+    print(f"Page size: {len(PAGE) / 1024:.0f} KiB, {lookups} lookups")
+    print(f"full download: {full_bytes / lookups / 1024:8.1f} KiB/lookup  {full_time / lookups * 1000:6.2f} ms/lookup")
+    print(f"stream scan:   {resolver.bytes_read / lookups / 1024:8.1f} KiB/lookup  {scan_time / lookups * 1000:6.2f} ms/lookup")
+    print(f"bytes saved:   {full_bytes / max(resolver.bytes_read, 1):8.1f}x")
+
+if __name__ == "__main__":
+    asyncio.run(main())
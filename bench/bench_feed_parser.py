@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Compares the streaming YouTube parser against feedparser.
+
+    python bench/bench_feed_parser.py [channels]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench.corpus import youtube_corpus
+from src.feeds import parse_youtube_feed, parse_feed_generic
+
+def run(parser, corpus):
+    start = time.perf_counter()
+    results = [parser(doc) for doc in corpus]
+    return time.perf_counter() - start, results
+
+def main():
+    channels = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    corpus = youtube_corpus(channels)
+    size = sum(len(doc) for doc in corpus)
+    print(f"Corpus: {channels} feeds, {size / 1024 / 1024:.1f} MiB")
+
+    fast_time, fast = run(parse_youtube_feed, corpus)
+    slow_time, slow = run(parse_feed_generic, corpus)
+    assert fast == slow, "parsers disagree"
+
+    print(f"feedparser:     {slow_time * 1000:8.1f} ms  ({slow_time / channels * 1000:.2f} ms/feed)")
+    print(f"youtube parser: {fast_time * 1000:8.1f} ms  ({fast_time / channels * 1000:.2f} ms/feed)")
+    print(f"speedup:        {slow_time / fast_time:8.1f}x")
+
+if __name__ == "__main__":
+    main()
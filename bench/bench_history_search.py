@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""History search over years of stored videos: the FTS5 index (kept current by
+triggers) vs. a LIKE scan. Checks the index against a plain tokenizing matcher
+after inserts, feed-refresh upserts, deletes and seen-mark compaction, and that
+the migration indexes an existing database.
+
+    python bench/bench_history_search.py [videos]
+"""
+import os
+import random
+import re
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from itertools import accumulate
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench.corpus import random_title, EMOJI
+from src.database import DatabaseManager, fts_match
+
+LIMIT = 200
+RANKED = 5000  # SEARCH_RANKED_MATCHES
+QUERIES = ["linux", "rust review", "homelab setup", "tier list", "speedrun 4k", "channel 42", "ep", "shorts", "zzz", "l"]
+UPSERT = '''INSERT INTO videos (video_id, title, channel, url, published_date, feed_url) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(video_id) DO UPDATE SET title = excluded.title, channel = excluded.channel'''
+SEEN = "INSERT OR IGNORE INTO seen_videos (video_id, title, seen_date) VALUES (?, ?, ?)"
+
+def vocabulary(rng, size=20000):
+    syllables = [c + v for c in "bcdfghklmnprstvz" for v in "aeiou"]
+    return list({"".join(rng.choices(syllables, k=rng.randint(1, 4))) for _ in range(size)})
+
+def history(count, rng, vocab):
+    """About three years of uploads from 300 channels; title words follow a Zipf distribution."""
+    start = datetime(2026, 10, 1)
+    cum_weights = list(accumulate(1 / rank for rank in range(1, len(vocab) + 1)))
+    rows = []
+    for i in range(count):
+        channel = rng.randrange(300)
+        published = start - timedelta(minutes=rng.randrange(3 * 365 * 24 * 60))
+        title = " ".join(rng.choices(vocab, cum_weights=cum_weights, k=rng.randint(3, 8))) + " " + random_title(rng)
+        rows.append((f"v{i:07d}", title, f"Channel {channel} {rng.choice(EMOJI)}",
+                     f"https://www.youtube.com/watch?v=v{i:07d}", published.isoformat(), f"feed{channel}"))
+    return rows
+
+def tokens(text):
+    return re.findall(r"\w+", (text or "").casefold())
+
+def documents(db):
+    """(video id, token set) for every indexed text."""
+    docs = [(r['video_id'], set(tokens(f"{r['title']} {r['channel']}")))
+            for r in db.fetchall("SELECT video_id, title, channel FROM videos")]
+    docs += [(r['video_id'], set(tokens(r['title'])))
+             for r in db.fetchall("SELECT video_id, title FROM seen_videos WHERE title IS NOT NULL")]
+    return docs
+
+def reference(docs, query):
+    """Ids the index should return: every query word a prefix of some title/channel token."""
+    words = tokens(query)
+    return {vid for vid, toks in docs if all(any(t.startswith(w) for t in toks) for w in words)}
+
+def indexed(db, query, limit=-1):
+    """search_history's queries."""
+    match = fts_match(query)
+    count = db.fetchone("SELECT count(*) FROM (SELECT 1 FROM videos_fts WHERE videos_fts MATCH ? LIMIT ?)",
+                        (match, RANKED + 1))[0]
+    order = "videos_fts.rowid DESC" if count > RANKED else "videos_fts.rank"
+    rows = db.fetchall(f'''SELECT v.video_id FROM videos_fts JOIN videos v ON v.rowid = videos_fts.rowid
+                         WHERE videos_fts MATCH ? ORDER BY {order} LIMIT ?''', (match, limit))
+    rows += db.fetchall('''SELECT s.video_id FROM seen_fts JOIN seen_videos s ON s.rowid = seen_fts.rowid
+                          WHERE seen_fts MATCH ? ORDER BY seen_fts.rank LIMIT ?''', (match, limit))
+    return [r['video_id'] for r in rows]
+
+def scanned(db, query, limit=LIMIT):
+    pattern = f"%{query}%"
+    return db.fetchall('''SELECT video_id FROM videos WHERE title LIKE ? OR channel LIKE ?
+                         ORDER BY published_date DESC LIMIT ?''', (pattern, pattern, limit))
+
+def check(db, rng, rows, queries):
+    # A feed refresh renaming some videos, deleted rows, seen-only titles, then compaction
+    renamed = [(r[0], random_title(rng), r[2], r[3], r[4], r[5]) for r in rng.sample(rows, len(rows) // 50)]
+    gone = [(r[0],) for r in rng.sample(rows, len(rows) // 100)]
+    now = datetime.now().isoformat()
+    with db.transaction():
+        db.executemany(UPSERT, renamed)
+        db.executemany(UPSERT, rows[:1000])  # Unchanged rows: the update trigger must not fire
+        db.executemany("DELETE FROM videos WHERE video_id = ?", gone)
+        db.executemany(SEEN, [(f"s{i:06d}", random_title(rng), now) for i in range(2000)])
+        db.executemany(SEEN, [(r[0], r[1], now) for r in rows[::7]])
+        db.execute('''UPDATE seen_videos SET title = NULL
+                     WHERE title IS NOT NULL AND video_id IN (SELECT video_id FROM videos)''')
+    db.conn.execute("INSERT INTO videos_fts (videos_fts) VALUES ('integrity-check')")
+    db.conn.execute("INSERT INTO seen_fts (seen_fts) VALUES ('integrity-check')")
+    docs = documents(db)
+    for query in queries:
+        got = indexed(db, query)
+        assert len(got) == len(set(got)), f"duplicate rows for {query!r}"
+        want = reference(docs, query)
+        assert set(got) == want, f"{query!r}: {len(set(got) - want)} extra, {len(want - set(got))} missing"
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return statistics.median(samples), samples[-1]
+
+def timed(fn, db, queries):
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(db, query)
+        samples.append((time.perf_counter() - start) * 1000)
+    return percentiles(samples)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(5)
+    vocab = vocabulary(rng)
+    rows = history(count, rng, vocab)
+    with tempfile.TemporaryDirectory() as tmp:
+        # An existing database from before the index: the migration builds it once
+        path = os.path.join(tmp, "ytrss.db")
+        DatabaseManager(path).connect()
+        conn = sqlite3.connect(path)
+        conn.executescript("".join(f"DROP TRIGGER {name};" for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%fts%'")))
+        conn.executescript("DROP TABLE videos_fts; DROP TABLE seen_fts;")
+        conn.executemany(UPSERT, rows)
+        conn.commit()
+        conn.close()
+        db = DatabaseManager(path)
+        start = time.perf_counter()
+        db.connect()
+        print(f"{count} videos, index built by the migration in {(time.perf_counter() - start) * 1000:.0f} ms")
+        assert db.has_fts
+
+        queries = QUERIES + [vocab[rank] for rank in (0, 1, 5, 20, 100, 1000, 10000)] + [f"{vocab[3]} {vocab[40]}"]
+        check(db, rng, rows, queries)
+        print(f"Index matches the reference for {len(queries)} queries after upserts, deletes and compaction")
+
+        for name, fn in (("LIKE scan", scanned), ("FTS5 index", lambda db, q: indexed(db, q, LIMIT))):
+            p50, worst = timed(fn, db, queries)
+            print(f"{name + ':':12} p50 {p50:7.2f} ms   max {worst:7.2f} ms")
+        common = db.fetchone("SELECT count(*) FROM videos_fts WHERE videos_fts MATCH ?", (fts_match("l"),))[0]
+        print(f"(the broadest query, 'l', matches {common} videos)")
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Parses a corpus of feeds through each parse_mode executor, the way a refresh does.
+
+    python bench/bench_parse_modes.py [channels]
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench.corpus import youtube_corpus
+from src.feeds import parse_feed, make_parse_executor, PARSE_MODES
+
+async def parse_all(executor, corpus):
+    loop = asyncio.get_running_loop()
+    if executor is None:
+        return [parse_feed(doc) for doc in corpus]
+    return await asyncio.gather(*(loop.run_in_executor(executor, parse_feed, doc) for doc in corpus))
+
+def main():
+    channels = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    corpus = youtube_corpus(channels)
+    print(f"Corpus: {channels} feeds, {os.cpu_count()} CPUs")
+    for mode in PARSE_MODES:
+        executor = make_parse_executor(mode)
+        if executor: asyncio.run(parse_all(executor, corpus[:os.cpu_count()]))  # Warm up workers
+        start = time.perf_counter()
+        asyncio.run(parse_all(executor, corpus))
+        elapsed = time.perf_counter() - start
+        if executor: executor.shutdown()
+        print(f"{mode:<8} {elapsed * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Per-keystroke search latency over a long video list: InquirerPy's fuzzy
+matcher rescoring every row vs. SearchIndex.
+
+    python bench/bench_search.py [rows]
+"""
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pfzy import fuzzy_match
+from bench.corpus import random_title, EMOJI
+from src.search import SearchIndex
+from src.ui import SEARCH_RESULTS
+
+FRAME_MS = 1000 / 60
+QUERIES = ["linux", "rust review", "homelab setup", "tier list 2024", "how i tried", "speedrun (4k)", "channel 42", "zzz"]
+
+def keystrokes():
+    for query in QUERIES:
+        for i in range(1, len(query) + 1):
+            yield query[:i]
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return statistics.median(samples), samples[int(len(samples) * 0.95)], samples[-1]
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 12000
+    rng = random.Random(3)
+    texts = [f"{random_title(rng)} Channel {rng.randrange(800)} {rng.choice(EMOJI)}" for _ in range(rows)]
+    print(f"{rows} rows, {sum(1 for _ in keystrokes())} keystrokes")
+
+    index = SearchIndex(texts)
+    start = time.perf_counter()
+    index.search("warm up")
+    print(f"index build:    {(time.perf_counter() - start) * 1000:8.1f} ms (once, on the first keystroke)")
+
+    haystack = [{"name": text} for text in texts]
+    fuzzy, indexed = [], []
+    for text in keystrokes():
+        start = time.perf_counter()
+        asyncio.run(fuzzy_match(text, haystack, key="name"))
+        fuzzy.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        index.search(text, SEARCH_RESULTS)
+        indexed.append((time.perf_counter() - start) * 1000)
+
+    for name, samples in (("fuzzy rescore", fuzzy), ("SearchIndex", indexed)):
+        p50, p95, worst = percentiles(samples)
+        print(f"{name + ':':15} p50 {p50:7.2f} ms   p95 {p95:7.2f} ms   max {worst:7.2f} ms")
+    p50, p95, worst = percentiles(indexed)
+    print(f"within a frame ({FRAME_MS:.1f} ms): {'yes' if worst < FRAME_MS else 'NO'}")
+
+if __name__ == "__main__":
+    main()
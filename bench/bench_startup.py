@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Cold start budget: runs `ytrss.py --profile-startup` against a synthetic
+profile (OPML + stored entries, no network needed to draw) and fails if the
+median time to first paint exceeds the budget. `entries` is the stored history per feed;
+first paint should not depend on it.
+
+    python bench/bench_startup.py [budget_ms] [runs] [entries]
+"""
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from bench.corpus import random_title
+from src.database import DatabaseManager
+
+BUDGET_MS = 450
+CHANNELS = 200
+TOTAL_RE = re.compile(r"([\d.]+) ms  total")
+MARK_RE = re.compile(r"^\s*([\d.]+) ms  (.+)$")
+
+def make_profile(home, channels=CHANNELS, entries=15):
+    config_dir = os.path.join(home, ".config", "ytrss")
+    os.makedirs(config_dir)
+    rng = random.Random(7)
+    root = ET.Element('opml', version="1.0")
+    ET.SubElement(root, 'head')
+    body = ET.SubElement(root, 'body')
+    rows = []
+    start = datetime(2026, 10, 1)
+    for ch in range(channels):
+        url = f"http://127.0.0.1:9/feeds/videos.xml?channel_id=UC{ch:022d}"
+        ET.SubElement(body, 'outline', {'text': f"Channel {ch}", 'title': f"Channel {ch}", 'type': 'rss', 'xmlUrl': url})
+        published = start
+        for i in range(entries):
+            published -= timedelta(hours=rng.randint(1, 96))
+            vid = f"{ch:05d}{i:06d}"
+            rows.append((vid, random_title(rng), f"Channel {ch}", f"https://www.youtube.com/watch?v={vid}",
+                         published.isoformat(), url))
+    ET.ElementTree(root).write(os.path.join(config_dir, "ytRss.opml"), encoding='UTF-8', xml_declaration=True)
+    db = DatabaseManager(os.path.join(config_dir, "ytrss.db"))
+    with db.transaction():
+        db.executemany('''INSERT INTO videos (video_id, title, channel, url, published_date, feed_url)
+                         VALUES (?, ?, ?, ?, ?, ?)''', rows)
+    db.close()
+
+def run_once(home):
+    env = dict(os.environ, HOME=home, TERM="dumb")
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, os.path.join(ROOT, "ytrss.py"), "--profile-startup"],
+                         env=env, capture_output=True, text=True, timeout=60).stdout
+    wall = (time.perf_counter() - start) * 1000
+    match = TOTAL_RE.search(out)
+    if not match: sys.exit(f"No startup report in the output:\n{out}")
+    marks = [(m.group(2), float(m.group(1))) for m in map(MARK_RE.match, out.splitlines()) if m]
+    return float(match.group(1)), wall, marks
+
+def main():
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_MS
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+    entries = int(sys.argv[3]) if len(sys.argv) > 3 else 15
+    with tempfile.TemporaryDirectory() as home:
+        make_profile(home, entries=entries)
+        run_once(home)  # First run compiles bytecode and runs the migrations
+        results = [run_once(home) for _ in range(runs)]
+
+    totals = [r[0] for r in results]
+    median = statistics.median(totals)
+    print(f"{CHANNELS} channels, {entries} stored entries each, {runs} runs")
+    for label, ms in min(results)[2]:
+        print(f"  {ms:8.1f} ms  {label}")
+    print(f"first paint: median {median:.1f} ms, best {min(totals):.1f} ms, worst {max(totals):.1f} ms")
+    print(f"process wall time (incl. interpreter start and exit): median {statistics.median(r[1] for r in results):.1f} ms")
+    if median > budget:
+        sys.exit(f"FAIL: median time to first paint {median:.1f} ms exceeds the {budget:.0f} ms budget")
+    print(f"OK: within the {budget:.0f} ms budget")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Builds the All Videos top-N from per-channel, newest-first lists: append-and-sort
+(the old way) vs. Timeline's k-way merge, plus a partial refresh merged in
+incrementally vs. rebuilding.
+
+    python bench/bench_timeline.py [channels] [refreshed channels]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.timeline import Timeline, merge_timelines
+
+TOP_N = 60
+PER_CHANNEL = 15
+ROUNDS = 20
+
+def channel_videos(ch, newest, rng):
+    published = newest - timedelta(hours=rng.uniform(0, 72))
+    videos = []
+    for i in range(PER_CHANNEL):
+        videos.append({'id': f"{ch:05d}{i:06d}", 'title': f"Video {i}", 'channel': f"Channel {ch}", 'feed': f"feed{ch}",
+                       'published': published.replace(microsecond=0).isoformat(), 'is_seen': False})
+        published -= timedelta(hours=rng.uniform(1, 24 * 14))
+    return videos
+
+def timed(fn):
+    start = time.perf_counter()
+    for _ in range(ROUNDS): result = fn()
+    return (time.perf_counter() - start) / ROUNDS, result
+
+def main():
+    channels = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    refreshed = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    rng = random.Random(7)
+    now = datetime(2024, 6, 1)
+    by_channel = {f"Channel {ch}": channel_videos(ch, now, rng) for ch in range(channels)}
+    print(f"{channels} channels x {PER_CHANNEL} entries, top {TOP_N}")
+
+    def full_sort():
+        flat = []
+        for videos in by_channel.values(): flat.extend(videos)
+        flat.sort(key=lambda v: v['published'], reverse=True)
+        return flat[:TOP_N]
+
+    sort_time, expected = timed(full_sort)
+    merge_time, timeline = timed(lambda: Timeline.from_channels(by_channel, TOP_N))
+    assert [v['id'] for v in timeline] == [v['id'] for v in expected]
+    print(f"  sort everything:     {sort_time * 1000:8.2f} ms")
+    print(f"  k-way merge top-N:   {merge_time * 1000:8.2f} ms  ({sort_time / merge_time:.1f}x)")
+
+    # A partial refresh: a few channels got two new uploads, which push their oldest two out of the window
+    changed = {}
+    sample = rng.sample(range(channels), refreshed)
+    for ch in sample:
+        name = f"Channel {ch}"
+        newest = datetime.fromisoformat(by_channel[name][0]['published'])
+        uploads = [dict(by_channel[name][0], id=f"{ch:05d}{PER_CHANNEL + i:06d}",
+                        published=(newest + timedelta(hours=12 * (2 - i))).isoformat()) for i in range(2)]
+        changed[name] = uploads + by_channel[name][:-2]
+    by_channel.update(changed)
+
+    def incremental():
+        t = Timeline(TOP_N)
+        t.items = list(timeline.items)
+        t.merge(merge_timelines(changed.values()), [f"feed{ch}" for ch in sample])
+        return t
+
+    rebuild_time, rebuilt = timed(lambda: Timeline.from_channels(by_channel, TOP_N))
+    incr_time, merged = timed(incremental)
+    assert [v['id'] for v in merged] == [v['id'] for v in rebuilt]
+    print(f"Partial refresh of {refreshed} channels:")
+    print(f"  rebuild top-N:       {rebuild_time * 1000:8.2f} ms")
+    print(f"  incremental merge:   {incr_time * 1000:8.2f} ms  ({rebuild_time / incr_time:.1f}x)")
+
+    # The newest channel's feed drops its top entries (deleted uploads) and the channel is renamed:
+    # its old rows must go, and the top-N either stays exact or asks for a rebuild
+    top = merged.items[0]
+    feed = top['feed']
+    renamed = [dict(v, channel="Renamed") for v in by_channel.pop(top['channel'])[3:]]
+    by_channel["Renamed"] = renamed
+    t = Timeline(TOP_N)
+    t.items = list(merged.items)
+    if not t.merge(renamed, [feed]): t = Timeline.from_channels(by_channel, TOP_N)
+    assert [v['id'] for v in t] == [v['id'] for v in Timeline.from_channels(by_channel, TOP_N)]
+    print("Rows that left a refreshed feed's window are dropped from the top-N")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Synthetic but real-shaped data for the benchmarks in this directory."""
+import random
+from datetime import datetime, timedelta
+
+TITLE_WORDS = ["Linux", "rust", "review", "BEST", "build", "vs", "how", "I", "tried", "2024", "setup",
+               "guide", "ultimate", "tier list", "speedrun", "homelab", "(4K)", "[LIVE]", "Ep.", "—", "|"]
+EMOJI = ["🔥", "🎮", "😱", "✅", "🚀", "💀", "🎄", "👀", "⭐", "🇸🇪", "👨‍💻"]
+
+def random_title(rng):
+    words = rng.choices(TITLE_WORDS, k=rng.randint(3, 10))
+    for _ in range(rng.randint(0, 3)):
+        words.insert(rng.randint(0, len(words)), rng.choice(EMOJI))
+    if rng.random() < 0.1: words.append("#shorts")
+    return " ".join(words)
+
+def youtube_feed(channel, entries=15, seed=None, start=None):
+    """An Atom document shaped like https://www.youtube.com/feeds/videos.xml?channel_id=..."""
+    rng = random.Random(seed if seed is not None else channel)
+    start = start or datetime(2026, 10, 1)
+    ch_id = f"UC{channel:022d}"
+    ch_name = f"Channel {channel} {rng.choice(EMOJI)} &amp; Friends"
+    out = ['<?xml version="1.0" encoding="UTF-8"?>',
+           '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns:media="http://search.yahoo.com/mrss/" xmlns="http://www.w3.org/2005/Atom">',
+           f' <link rel="self" href="http://www.youtube.com/feeds/videos.xml?channel_id={ch_id}"/>',
+           f' <id>yt:channel:{ch_id[2:]}</id>',
+           f' <yt:channelId>{ch_id[2:]}</yt:channelId>',
+           f' <title>{ch_name}</title>',
+           f' <link rel="alternate" href="https://www.youtube.com/channel/{ch_id}"/>',
+           f' <author><name>{ch_name}</name><uri>https://www.youtube.com/channel/{ch_id}</uri></author>',
+           ' <published>2012-03-04T10:11:12+00:00</published>']
+    published = start
+    for i in range(entries):
+        published -= timedelta(hours=rng.randint(1, 96), minutes=rng.randint(0, 59))
+        vid = f"{channel:05d}{i:06d}"
+        title = random_title(rng).replace("&", "&amp;")
+        desc = " ".join(random_title(rng) for _ in range(rng.randint(5, 30))).replace("&", "&amp;")
+        out.append(f''' <entry>
+  <id>yt:video:{vid}</id>
+  <yt:videoId>{vid}</yt:videoId>
+  <yt:channelId>{ch_id}</yt:channelId>
+  <title>{title}</title>
+  <link rel="alternate" href="https://www.youtube.com/watch?v={vid}"/>
+  <author><name>{ch_name}</name><uri>https://www.youtube.com/channel/{ch_id}</uri></author>
+  <published>{published.isoformat()}+00:00</published>
+  <updated>{(published + timedelta(days=1)).isoformat()}+00:00</updated>
+  <media:group>
+   <media:title>{title}</media:title>
+   <media:content url="https://www.youtube.com/v/{vid}?version=3" type="application/x-shockwave-flash" width="640" height="390"/>
+   <media:thumbnail url="https://i1.ytimg.com/vi/{vid}/hqdefault.jpg" width="480" height="360"/>
+   <media:description>{desc}
+https://example.com/links/{vid}</media:description>
+   <media:community>
+    <media:starRating count="{rng.randint(0, 9999)}" average="5.00" min="1" max="5"/>
+    <media:statistics views="{rng.randint(0, 999999)}"/>
+   </media:community>
+  </media:group>
+ </entry>''')
+    out.append('</feed>')
+    return "\n".join(out).encode('utf-8')
+
+def youtube_corpus(channels=200, entries=15):
+    return [youtube_feed(ch, entries) for ch in range(channels)]
@@ -0,0 +1,77 @@
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from src.database import console
+
+class AsyncDatabase:
+    """Awaitable front for a DatabaseManager, so coroutines never block the event loop on SQLite.
+
+    Every call runs on one dedicated thread, in submission order. Small
+    fire-and-forget writes (write/write_many) are queued for `flush_delay`
+    seconds and committed together in one transaction; anything submitted
+    later, reads included, runs after that batch, so callers always read
+    their own writes.
+    """
+    def __init__(self, db, flush_delay=0.05):
+        self.db = db
+        self.flush_delay = flush_delay
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ytrss-db")
+        self.pending = []
+        self.flush_handle = None
+        self.last_flush = None
+
+    def _submit(self, fn, *args):
+        self._flush_now()
+        return asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    async def run(self, fn, *args):
+        """Runs fn(*args) on the database thread. Use for multi-statement work built on `db`."""
+        return await self._submit(fn, *args)
+
+    async def fetchall(self, query, params=()):
+        return await self._submit(self.db.fetchall, query, params)
+
+    async def fetchone(self, query, params=()):
+        return await self._submit(self.db.fetchone, query, params)
+
+    async def execute(self, query, params=()):
+        await self._submit(self.db.execute, query, params)
+
+    def write(self, query, params=()):
+        """Queues a write; it is committed with the next batch."""
+        self.pending.append((query, params))
+        if self.flush_handle is None:
+            self.flush_handle = asyncio.get_running_loop().call_later(self.flush_delay, self._flush_now)
+
+    def write_many(self, query, params_list):
+        for params in params_list:
+            self.write(query, params)
+
+    def _flush_now(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if not self.pending: return
+        batch, self.pending = self.pending, []
+        self.last_flush = asyncio.get_running_loop().run_in_executor(self.executor, self._write_batch, batch)
+
+    def _write_batch(self, batch):
+        # Consecutive writes of the same statement go through one executemany
+        try:
+            with self.db.transaction():
+                for query, group in groupby(batch, key=lambda item: item[0]):
+                    self.db.executemany(query, [params for _, params in group])
+        except sqlite3.Error as e:
+            # Nobody awaits a queued write; report it like any other DB error (the batch was rolled back)
+            console.print(f"DB Error: {e}", style="red")
+
+    async def flush(self):
+        self._flush_now()
+        if self.last_flush is not None:
+            await self.last_flush
+
+    async def close(self):
+        await self.flush()
+        await self._submit(self.db.close)
+        self.executor.shutdown(wait=True)
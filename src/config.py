@@ -17,6 +17,37 @@ class ConfigManager:
         self.config['General'].setdefault('show_shorts', 'True')
         self.config['General'].setdefault('seasonal_themes', 'True')
         self.config['General'].setdefault('multi_playlists', 'False')
+        # Stored videos published longer ago than this leave the store with their seen-marks,
+        # unless in a playlist or still in their feed (0 = keep forever, for history search)
+        self.config['General'].setdefault('history_retention_days', '0')
+        # Seen-marks of videos not in the store (kept from before it existed) are pruned after this (0 = keep forever)
+        self.config['General'].setdefault('seen_retention_days', '365')
+        # Durations kept in memory; the rest are read from the database on demand
+        self.config['General'].setdefault('duration_cache_size', '5000')
+        # Feed parsing executor: thread, process or inline. 0 workers = one per CPU
+        self.config['General'].setdefault('parse_mode', 'thread')
+        self.config['General'].setdefault('parse_workers', '0')
+
+        # Feed refresh HTTP client (timeouts in seconds)
+        if 'Network' not in self.config:
+            self.config['Network'] = {}
+        self.config['Network'].setdefault('max_connections', '20')
+        self.config['Network'].setdefault('per_host_connections', '6')
+        self.config['Network'].setdefault('total_timeout', '20')
+        self.config['Network'].setdefault('connect_timeout', '5')
+        self.config['Network'].setdefault('retries', '3')
+        self.config['Network'].setdefault('backoff', '0.5')
+        self.config['Network'].setdefault('duration_retry_hours', '24')
+        self.config['Network'].setdefault('duration_scan_kb', '1024')
+
+        # Background refresh; poll intervals adapt per channel within these bounds
+        if 'Refresh' not in self.config:
+            self.config['Refresh'] = {}
+        self.config['Refresh'].setdefault('auto_refresh', 'True')
+        self.config['Refresh'].setdefault('min_poll_minutes', '15')
+        self.config['Refresh'].setdefault('max_poll_minutes', '720')
+        self.config['Refresh'].setdefault('prefetch_durations', 'True')
+        self.config['Refresh'].setdefault('prefetch_concurrency', '3')
 
     def save(self):
         os.makedirs(os.path.dirname(self.conf_file), exist_ok=True)
@@ -26,6 +57,15 @@ class ConfigManager:
     def get_bool(self, section, key):
         return self.config.getboolean(section, key)
 
+    def get_str(self, section, key):
+        return self.config.get(section, key)
+
+    def get_int(self, section, key):
+        return self.config.getint(section, key)
+
+    def get_float(self, section, key):
+        return self.config.getfloat(section, key)
+
     def set_val(self, section, key, value):
         self.config[section][key] = str(value)
         self.save()
@@ -0,0 +1,160 @@
+import asyncio
+import itertools
+import json
+import os
+from collections import deque
+from src.scheduler import RefreshScheduler
+
+MESSAGE_LIMIT = 64 * 1024 * 1024  # Longest line on the socket (a video list is one message)
+
+class DaemonError(Exception):
+    """The daemon reported an error, or the connection to it was lost."""
+
+def _encode(message):
+    return json.dumps(message, ensure_ascii=False).encode('utf-8') + b"\n"
+
+class DaemonServer:
+    """Serves `handlers` (name -> coroutine function) over a Unix domain socket.
+
+    One JSON message per line. A request {"id": 1, "method": "status",
+    "params": [...]} is answered with {"id": 1, "result": ...} or
+    {"id": 1, "error": "..."}; requests without an id are notifications
+    and get no reply. Requests are handled concurrently, so a slow one
+    (e.g. a refresh) doesn't hold up the rest of that client's calls.
+    """
+    def __init__(self, path, handlers):
+        self.path = path
+        self.handlers = handlers
+        self.server = None
+        self.tasks = set()
+
+    async def start(self):
+        if os.path.exists(self.path):
+            client = await DaemonClient.connect(self.path)
+            if client is not None:
+                await client.close()
+                raise DaemonError(f"A daemon is already listening on {self.path}")
+            os.remove(self.path)  # Left behind by a daemon that didn't shut down cleanly
+        self.server = await asyncio.start_unix_server(self._serve, path=self.path, limit=MESSAGE_LIMIT)
+        os.chmod(self.path, 0o600)
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+            if os.path.exists(self.path): os.remove(self.path)
+
+    async def _serve(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                try: message = json.loads(line)
+                except ValueError: continue
+                task = asyncio.ensure_future(self._handle(message, writer))
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(self, message, writer):
+        reply = {"id": message.get("id")}
+        try:
+            handler = self.handlers[message.get("method")]
+            reply["result"] = await handler(*message.get("params", []))
+        except KeyError:
+            reply["error"] = f"Unknown method: {message.get('method')}"
+        except Exception as e:
+            reply["error"] = f"{type(e).__name__}: {e}"
+        if reply["id"] is None or writer.is_closing(): return
+        writer.write(_encode(reply))
+
+class DaemonClient:
+    """Connection to a running daemon. connect() returns None when there is none."""
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.ids = itertools.count(1)
+        self.pending = {}
+        self.closed = False
+        self.read_task = asyncio.ensure_future(self._read())
+
+    @classmethod
+    async def connect(cls, path, timeout=1.0):
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(path, limit=MESSAGE_LIMIT), timeout)
+        except (OSError, asyncio.TimeoutError, AttributeError, NotImplementedError):
+            return None  # No socket, a stale one, or no Unix sockets on this platform
+        return cls(reader, writer)
+
+    async def call(self, method, *params):
+        if self.closed: raise DaemonError("Lost connection to the ytrss daemon")
+        request_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        self.writer.write(_encode({"id": request_id, "method": method, "params": params}))
+        return await future
+
+    def notify(self, method, *params):
+        """Fire-and-forget request; the daemon sends no reply."""
+        if self.closed: raise DaemonError("Lost connection to the ytrss daemon")
+        self.writer.write(_encode({"method": method, "params": params}))
+
+    async def _read(self):
+        try:
+            while line := await self.reader.readline():
+                reply = json.loads(line)
+                future = self.pending.pop(reply.get("id"), None)
+                if future is None or future.done(): continue
+                if "error" in reply: future.set_exception(DaemonError(reply["error"]))
+                else: future.set_result(reply.get("result"))
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            self.closed = True
+            for future in self.pending.values():
+                if not future.done(): future.set_exception(DaemonError("Lost connection to the ytrss daemon"))
+            self.pending.clear()
+
+    async def close(self):
+        self.read_task.cancel()
+        self.writer.close()
+        self.closed = True
+
+class RemoteScheduler:
+    """The daemon's RefreshScheduler as seen by a client, as of the last sync().
+
+    Has the attributes and methods the dashboard uses, so it can stand in
+    for a local scheduler.
+    """
+    def __init__(self, client):
+        self.client = client
+        self.generation = 0
+        self.busy = False
+        self.summary = None
+        self.refreshed = deque()
+
+    def _update(self, status):
+        self.generation = status['generation']
+        self.busy = status['busy']
+        self.summary = status['summary']
+        self.refreshed = deque(status['refreshed'])
+
+    async def sync(self):
+        self._update(await self.client.call("status"))
+
+    def set_feeds(self, feeds):
+        self.client.notify("set_feeds", feeds)
+
+    def start(self):
+        pass  # The daemon's scheduler is always running
+
+    def stop(self):
+        pass
+
+    async def refresh_now(self):
+        self._update(await self.client.call("refresh"))
+
+    refreshed_since = RefreshScheduler.refreshed_since
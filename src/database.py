@@ -1,18 +1,35 @@
 import sqlite3
+from contextlib import contextmanager
 from rich.console import Console
+from src.utils import parse_duration
 
 # Create a local console for logging errors within this module
 console = Console()
 
+def fts_match(text):
+    """Free text -> FTS5 MATCH expression: every word required, each as a prefix."""
+    words = text.split()
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+
 class DatabaseManager:
-    def __init__(self, db_file):
+    def __init__(self, db_file, wal=True):
         self.db_file = db_file
+        self.wal = wal
         self.conn = None
+        self.tx_depth = 0
+        self.commits = 0
+        self.has_fts = False  # Set by the migration
 
     def connect(self):
         if self.conn is None:
-            self.conn = sqlite3.connect(self.db_file)
+            # sqlite3 reuses prepared statements by SQL string; the default 128-entry cache is
+            # doubled so the IN (?, ...) lists, one string per length, don't evict the rest
+            self.conn = sqlite3.connect(self.db_file, cached_statements=256)
             self.conn.row_factory = sqlite3.Row
+            if self.wal:
+                # WAL: readers don't block the writer, and commits skip the rollback-journal fsyncs
+                self.conn.execute("PRAGMA journal_mode=WAL")
+                self.conn.execute("PRAGMA synchronous=NORMAL")
             self._migrate()
     
     def _migrate(self):
@@ -45,17 +62,125 @@ class DatabaseManager:
                         FOREIGN KEY (video_id) REFERENCES videos(video_id) ON DELETE CASCADE,
                         PRIMARY KEY (playlist_id, video_id)
                      )''')
+        # Conditional GET validators and the last parsed entries per feed URL
+        c.execute('''CREATE TABLE IF NOT EXISTS feed_cache (
+                        url TEXT PRIMARY KEY,
+                        etag TEXT,
+                        last_modified TEXT,
+                        feed_title TEXT,
+                        entries TEXT,
+                        fetched_at TEXT
+                     )''')
+        # Failed duration lookups are negatively cached: duration NULL, failed_at set
+        columns = [row[1] for row in c.execute("PRAGMA table_info(video_metadata)")]
+        if 'failed_at' not in columns:
+            c.execute("ALTER TABLE video_metadata ADD COLUMN failed_at TEXT")
+        # Every parsed feed entry is kept in `videos`; feed_url ties it to its subscription
+        columns = [row[1] for row in c.execute("PRAGMA table_info(videos)")]
+        if 'feed_url' not in columns:
+            c.execute("ALTER TABLE videos ADD COLUMN feed_url TEXT")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_videos_feed_url ON videos (feed_url, published_date)")
+        # Durations as integer seconds next to the display string, for shorts checks and length filters
+        for table in ('video_metadata', 'videos'):
+            columns = [row[1] for row in c.execute(f"PRAGMA table_info({table})")]
+            if 'duration_seconds' not in columns:
+                c.execute(f"ALTER TABLE {table} ADD COLUMN duration_seconds INTEGER")
+                if table == 'videos':
+                    # Resolved durations used to live only in video_metadata
+                    c.execute('''UPDATE videos SET duration = (
+                                    SELECT m.duration FROM video_metadata m WHERE m.video_id = videos.video_id)
+                                 WHERE video_id IN (SELECT video_id FROM video_metadata WHERE duration IS NOT NULL)''')
+                rows = c.execute(f"SELECT video_id, duration FROM {table} WHERE duration IS NOT NULL").fetchall()
+                c.executemany(f"UPDATE {table} SET duration_seconds = ? WHERE video_id = ?",
+                              [(parse_duration(row[1]), row[0]) for row in rows])
+        c.execute("CREATE INDEX IF NOT EXISTS idx_videos_duration ON videos (duration_seconds, published_date)")
+        # playlist_items' primary key only covers lookups by playlist_id first
+        c.execute("CREATE INDEX IF NOT EXISTS idx_playlist_items_video ON playlist_items (video_id)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_playlist_items_added ON playlist_items (playlist_id, added_at)")
         c.execute("INSERT OR IGNORE INTO playlists (name, is_system_list) VALUES (?, ?)", ("Watch Later", 1))
+        self._migrate_search(c)
+        self._commit()
+
+    def _migrate_search(self, c):
+        """Full-text index over every stored title and channel, kept current by triggers.
+
+        Both indexes are external-content FTS5 tables over the rowids of
+        `videos` and `seen_videos`, so no text is stored twice. seen_videos
+        only contributes titles of videos missing from `videos`.
+        """
+        c.execute("SELECT 1 FROM sqlite_master WHERE name = 'videos_fts'")
+        self.has_fts = c.fetchone() is not None
+        if self.has_fts: return
+        try:
+            c.execute('''CREATE VIRTUAL TABLE videos_fts USING fts5(
+                            title, channel, content='videos', content_rowid='rowid',
+                            tokenize='unicode61 remove_diacritics 2', prefix='2 3')''')
+            c.execute('''CREATE VIRTUAL TABLE seen_fts USING fts5(
+                            title, content='seen_videos', content_rowid='rowid',
+                            tokenize='unicode61 remove_diacritics 2', prefix='2 3')''')
+        except sqlite3.OperationalError:
+            return  # SQLite built without FTS5: search falls back to LIKE
+        self.has_fts = True
+        c.execute('''CREATE TRIGGER videos_fts_insert AFTER INSERT ON videos BEGIN
+                        INSERT INTO videos_fts (rowid, title, channel) VALUES (new.rowid, new.title, new.channel);
+                     END''')
+        c.execute('''CREATE TRIGGER videos_fts_delete AFTER DELETE ON videos BEGIN
+                        INSERT INTO videos_fts (videos_fts, rowid, title, channel) VALUES ('delete', old.rowid, old.title, old.channel);
+                     END''')
+        # Feed refreshes rewrite every row; only reindex when the text actually changed
+        c.execute('''CREATE TRIGGER videos_fts_update AFTER UPDATE OF title, channel ON videos
+                     WHEN old.title IS NOT new.title OR old.channel IS NOT new.channel BEGIN
+                        INSERT INTO videos_fts (videos_fts, rowid, title, channel) VALUES ('delete', old.rowid, old.title, old.channel);
+                        INSERT INTO videos_fts (rowid, title, channel) VALUES (new.rowid, new.title, new.channel);
+                     END''')
+        c.execute('''CREATE TRIGGER seen_fts_insert AFTER INSERT ON seen_videos BEGIN
+                        INSERT INTO seen_fts (rowid, title) VALUES (new.rowid, new.title);
+                     END''')
+        c.execute('''CREATE TRIGGER seen_fts_delete AFTER DELETE ON seen_videos BEGIN
+                        INSERT INTO seen_fts (seen_fts, rowid, title) VALUES ('delete', old.rowid, old.title);
+                     END''')
+        c.execute('''CREATE TRIGGER seen_fts_update AFTER UPDATE OF title ON seen_videos
+                     WHEN old.title IS NOT new.title BEGIN
+                        INSERT INTO seen_fts (seen_fts, rowid, title) VALUES ('delete', old.rowid, old.title);
+                        INSERT INTO seen_fts (rowid, title) VALUES (new.rowid, new.title);
+                     END''')
+        # Title hits rank above channel hits
+        c.execute("INSERT INTO videos_fts (videos_fts, rank) VALUES ('rank', 'bm25(10.0, 3.0)')")
+        c.execute("INSERT INTO videos_fts (videos_fts) VALUES ('rebuild')")
+        c.execute("INSERT INTO seen_fts (seen_fts) VALUES ('rebuild')")
+
+    def _commit(self):
         self.conn.commit()
+        self.commits += 1
+
+    @contextmanager
+    def transaction(self):
+        """Groups every write inside the block into a single commit.
+
+        Nested blocks join the outermost one. The transaction is rolled
+        back if the block raises; inside a block, execute() and
+        executemany() raise on errors instead of logging them.
+        """
+        if not self.conn: self.connect()
+        self.tx_depth += 1
+        try:
+            yield self
+        except Exception:
+            self.tx_depth -= 1
+            if self.tx_depth == 0: self.conn.rollback()
+            raise
+        self.tx_depth -= 1
+        if self.tx_depth == 0: self._commit()
 
     def execute(self, query, params=()):
         if not self.conn: self.connect()
         try:
             c = self.conn.cursor()
             c.execute(query, params)
-            self.conn.commit()
+            if not self.tx_depth: self._commit()
             return c
         except Exception as e:
+            if self.tx_depth: raise  # Let transaction() roll back the whole block
             console.print(f"DB Error: {e}", style="red")
             return None
 
@@ -64,9 +189,10 @@ class DatabaseManager:
         try:
             c = self.conn.cursor()
             c.executemany(query, params_list)
-            self.conn.commit()
+            if not self.tx_depth: self._commit()
             return c
         except Exception as e:
+            if self.tx_depth: raise
             console.print(f"DB Error: {e}", style="red")
             return None
             
@@ -0,0 +1,320 @@
+import asyncio
+import re
+from collections import deque
+from datetime import datetime
+from src.utils import LRUCache, parse_duration, import_in_background
+
+UNKNOWN = "??:??"
+OFFLINE = object()  # _scrape couldn't get the watch page: not a miss, the video stays retryable
+DURATION_RE = re.compile(rb'itemprop="duration" content="PT(\d+H)?(\d+M)?(\d+S)?"')
+# The player response carries the same value and usually appears earlier in the page
+LENGTH_SECONDS_RE = re.compile(rb'"lengthSeconds":"(\d+)"')
+SCAN_CHUNK = 16 * 1024
+SCAN_OVERLAP = 128  # Longer than either pattern, so a match split across chunks is still seen
+YTDLP_BATCH_WINDOW = 0.05  # Seconds to wait for other misses to join a yt-dlp batch
+YTDLP_BATCH_SIZE = 50
+WARM_CHUNK = 500  # Ids per bulk SELECT, below SQLite's bound-parameter limit
+# Resolved durations live in `videos`; video_metadata only keeps failures and
+# durations of videos that haven't reached the store yet
+STORED_SQL = '''SELECT video_id, duration, failed_at FROM video_metadata WHERE video_id IN ({marks})
+                UNION ALL
+                SELECT video_id, duration, NULL FROM videos WHERE duration_seconds IS NOT NULL AND video_id IN ({marks})'''
+
+def stored_sql(count):
+    # Numbered parameters, so both halves of the UNION share one set of ids
+    return STORED_SQL.format(marks=','.join(f'?{i}' for i in range(1, count + 1)))
+
+def format_iso_duration(match):
+    """PT1H2M3S regex match -> '1:02:03' / '2:03'."""
+    h = match.group(1)[:-1].decode() if match.group(1) else "0"
+    m = match.group(2)[:-1].decode() if match.group(2) else "0"
+    s = match.group(3)[:-1].decode() if match.group(3) else "0"
+    if int(h) > 0:
+        return f"{h}:{m.zfill(2)}:{s.zfill(2)}"
+    return f"{m}:{s.zfill(2)}"
+
+def format_seconds(total):
+    h, rest = divmod(int(total), 3600)
+    m, s = divmod(rest, 60)
+    if h > 0:
+        return f"{h}:{m:02d}:{s:02d}"
+    return f"{m}:{s:02d}"
+
+def scan_duration(buf):
+    """Duration string if buf contains either duration marker, else None."""
+    match = DURATION_RE.search(buf)
+    if match: return format_iso_duration(match)
+    match = LENGTH_SECONDS_RE.search(buf)
+    if match: return format_seconds(match.group(1))
+    return None
+
+def _load_aiohttp():
+    import aiohttp
+    return aiohttp
+
+class DurationResolver:
+    """Looks up video durations, backed by the videos and video_metadata tables (through an AsyncDatabase).
+
+    Keeps one pooled session for its lifetime, coalesces concurrent lookups
+    for the same video into a single request, and remembers failures for
+    `failure_ttl` seconds so "??:??" videos are not re-scraped on every visit.
+    Rows are loaded on demand (or in bulk via warm()) into a bounded LRU
+    of (duration, failed_at) entries rather than read in full at startup.
+    """
+    def __init__(self, db, user_agent, failure_ttl=86400, timeout=5, max_scan_bytes=1024 * 1024, cache_size=5000):
+        self.db = db
+        self.user_agent = user_agent
+        self.failure_ttl = failure_ttl
+        self.timeout = timeout
+        self.max_scan_bytes = max_scan_bytes
+        self.bytes_read = 0  # Watch page bytes downloaded, for benchmarking
+        self.cache = LRUCache(cache_size)
+        self.db_hits = 0
+        self.lookups = 0
+        self.inflight = {}
+        self.session = None
+        self.ytdlp_pending = {}
+        self.ytdlp_task = None
+
+    def _entry_from_row(self, row):
+        failed_at = None
+        if not row['duration'] and row['failed_at']:
+            try: failed_at = datetime.fromisoformat(row['failed_at'])
+            except ValueError: pass
+        return (row['duration'] or None, failed_at)
+
+    def _cache_rows(self, rows):
+        for row in rows:
+            entry = self._entry_from_row(row)
+            # A duration from either table beats a recorded failure
+            if entry[0] or self.cache.peek(row['video_id']) is None:
+                self.cache.put(row['video_id'], entry)
+
+    async def warm(self, video_ids):
+        """Bulk-loads stored durations and failures for the given ids into the cache."""
+        missing = [vid for vid in dict.fromkeys(video_ids) if vid not in self.cache]
+        for i in range(0, len(missing), WARM_CHUNK):
+            chunk = missing[i:i + WARM_CHUNK]
+            self._cache_rows(await self.db.fetchall(stored_sql(len(chunk)), chunk))
+
+    async def evict_stale(self):
+        """Drops metadata rows for videos no longer in the store, rows `videos` already
+        has the duration for, and expired failures, so video_metadata stays small."""
+        cutoff = datetime.fromtimestamp(datetime.now().timestamp() - self.failure_ttl).isoformat()
+        await self.db.execute('''DELETE FROM video_metadata
+                                 WHERE video_id NOT IN (SELECT video_id FROM videos)
+                                    OR video_id IN (SELECT video_id FROM videos WHERE duration_seconds IS NOT NULL)
+                                    OR (duration IS NULL AND failed_at < ?)''', (cutoff,))
+
+    def stats(self):
+        return {'size': len(self.cache), 'hits': self.cache.hits, 'misses': self.cache.misses,
+                'db_hits': self.db_hits, 'lookups': self.lookups}
+
+    def summary(self):
+        """Status-line text for the lookups so far, or None if no duration was needed yet."""
+        s = self.stats()
+        checks = s['hits'] + s['misses']
+        if not checks: return None
+        return (f"durations: {s['hits'] * 100 // checks}% cache hits, "
+                f"{s['db_hits']} from the database, {s['lookups']} fetched")
+
+    def get(self, video_id):
+        """Known duration or None, without touching the network or the database."""
+        entry = self.cache.peek(video_id)
+        return entry[0] if entry else None
+
+    def needs_lookup(self, video_id):
+        # peek(), so only resolve() shows up in the hit rate
+        entry = self.cache.peek(video_id)
+        return entry is None or (entry[0] is None and not self._failed_recently(entry))
+
+    def _failed_recently(self, entry):
+        failed_at = entry[1]
+        return failed_at is not None and (datetime.now() - failed_at).total_seconds() < self.failure_ttl
+
+    async def _get_session(self):
+        if self.session is None or self.session.closed:
+            # aiohttp is only loaded once the first lookup needs it, off the event loop
+            aiohttp = await import_in_background(_load_aiohttp)
+            if self.session is None or self.session.closed:  # Another lookup may have opened one meanwhile
+                connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+                self.session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout),
+                                                     headers={"User-Agent": self.user_agent})
+        return self.session
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def resolve(self, video_url, video_id):
+        entry = self.cache.get(video_id)
+        if entry:
+            if entry[0]: return entry[0]
+            if self._failed_recently(entry): return UNKNOWN
+
+        task = self.inflight.get(video_id)
+        if task is None:
+            task = asyncio.ensure_future(self._lookup(video_url, video_id))
+            self.inflight[video_id] = task
+            task.add_done_callback(lambda _: self.inflight.pop(video_id, None))
+        # Shield so one caller being cancelled doesn't abort the lookup for the others
+        return await asyncio.shield(task)
+
+    async def _lookup(self, video_url, video_id):
+        if video_id not in self.cache:
+            self._cache_rows(await self.db.fetchall(stored_sql(1), (video_id,)))
+            entry = self.cache.peek(video_id)
+            if entry and (entry[0] or self._failed_recently(entry)):
+                self.db_hits += 1
+                return entry[0] or UNKNOWN
+
+        self.lookups += 1
+        duration = await self._scrape(video_url)
+        if duration is OFFLINE: return UNKNOWN
+        if duration is not None:
+            self._remember([(video_id, duration)])
+            return duration
+        # The batch runner remembers the result (or the failure) itself
+        duration = await self._ytdlp(video_url, video_id)
+        return duration or UNKNOWN
+
+    def _remember(self, results):
+        """Caches [(video_id, duration or None)] and queues the video_metadata (and videos) writes as one batch."""
+        now = datetime.now()
+        rows = []
+        known = []
+        for video_id, duration in results:
+            if duration:
+                self.cache.put(video_id, (duration, None))
+                seconds = parse_duration(duration)
+                rows.append((video_id, duration, seconds, None))
+                known.append((duration, seconds, video_id))
+            else:
+                self.cache.put(video_id, (None, now))
+                rows.append((video_id, None, None, now.isoformat()))
+        if rows:
+            self.db.write_many('''INSERT OR REPLACE INTO video_metadata (video_id, duration, duration_seconds, failed_at)
+                                  VALUES (?, ?, ?, ?)''', rows)
+        if known:
+            # Keep the entry store in step, so length filters are answered from `videos` alone
+            self.db.write_many("UPDATE videos SET duration = ?, duration_seconds = ? WHERE video_id = ?", known)
+
+    async def _scrape(self, video_url):
+        """Duration from the watch page, None if the page has none, or OFFLINE if it couldn't be read."""
+        # Light-weight HTML scrape: stream the watch page and stop at the first
+        # <meta itemprop="duration" content="PT3M45S"> or "lengthSeconds":"225"
+        try:
+            async with (await self._get_session()).get(video_url) as resp:
+                if resp.status != 200: return OFFLINE  # Rate limited or a server error: try again later
+                tail = b""
+                read = 0
+                try:
+                    async for chunk in resp.content.iter_chunked(SCAN_CHUNK):
+                        read += len(chunk)
+                        buf = tail + chunk
+                        duration = scan_duration(buf)
+                        if duration or read >= self.max_scan_bytes:
+                            return duration
+                        tail = buf[-SCAN_OVERLAP:]
+                finally:
+                    self.bytes_read += read
+                    # Drop the connection instead of draining the rest of the page
+                    if not resp.content.at_eof(): resp.close()
+        except Exception:
+            return OFFLINE  # No connection, DNS failure, timeout
+        return None
+
+    async def _ytdlp(self, video_url, video_id):
+        """yt-dlp fallback. Misses are collected and resolved by one yt-dlp process per batch."""
+        future = asyncio.get_running_loop().create_future()
+        self.ytdlp_pending[video_id] = (video_url, future)
+        if self.ytdlp_task is None or self.ytdlp_task.done():
+            self.ytdlp_task = asyncio.ensure_future(self._ytdlp_batches())
+        return await future
+
+    async def _ytdlp_batches(self):
+        while self.ytdlp_pending:
+            await asyncio.sleep(YTDLP_BATCH_WINDOW)
+            items = list(self.ytdlp_pending.items())
+            self.ytdlp_pending = {}
+            for i in range(0, len(items), YTDLP_BATCH_SIZE):
+                await self._ytdlp_batch(dict(items[i:i + YTDLP_BATCH_SIZE]))
+
+    async def _ytdlp_batch(self, batch):
+        by_url = {url: video_id for video_id, (url, _) in batch.items()}
+        results = {}
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "yt-dlp", "--ignore-errors", "--no-warnings", "--skip-download",
+                "--print", "%(id)s\t%(original_url)s\t%(duration)s", *by_url,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            # Results stream back one line per video as yt-dlp gets to it
+            async for line in proc.stdout:
+                try:
+                    yt_id, url, seconds = line.decode().rstrip("\n").split("\t")
+                    video_id = by_url.get(url) or (yt_id if yt_id in batch else None)
+                    if video_id is None or video_id in results: continue
+                    duration = format_seconds(float(seconds))
+                except ValueError:
+                    continue
+                results[video_id] = duration
+                future = batch[video_id][1]
+                if not future.done(): future.set_result(duration)
+            await proc.wait()
+        except Exception: pass
+        finally:
+            for video_id, (_, future) in batch.items():
+                if not future.done(): future.set_result(results.get(video_id))
+            self._remember([(video_id, results.get(video_id)) for video_id in batch])
+
+class DurationPrefetcher:
+    """Resolves durations in the background, in the order the user is likely to view them.
+
+    At most `concurrency` lookups run at a time. schedule() replaces the
+    queue; promote() moves a list to the front (e.g. the one being opened).
+    """
+    def __init__(self, resolver, concurrency=3):
+        self.resolver = resolver
+        self.concurrency = concurrency
+        self.queue = deque()
+        self.wake = asyncio.Event()
+        self.workers = []
+
+    def _pending(self, videos):
+        seen = set()
+        for v in videos:
+            if v['id'] in seen or not self.resolver.needs_lookup(v['id']): continue
+            seen.add(v['id'])
+            yield (v['link'], v['id'])
+
+    def schedule(self, videos):
+        self.queue = deque(self._pending(videos))
+        self.start()
+
+    def promote(self, videos):
+        front = list(self._pending(videos))
+        ids = {video_id for _, video_id in front}
+        self.queue = deque(front + [item for item in self.queue if item[1] not in ids])
+        self.start()
+
+    def start(self):
+        if not self.workers:
+            self.workers = [asyncio.ensure_future(self._work()) for _ in range(self.concurrency)]
+        self.wake.set()
+
+    def stop(self):
+        for task in self.workers: task.cancel()
+        self.workers = []
+
+    async def _work(self):
+        while True:
+            if not self.queue:
+                self.wake.clear()
+                await self.wake.wait()
+                continue
+            video_url, video_id = self.queue.popleft()
+            try: await self.resolver.resolve(video_url, video_id)
+            except Exception: pass
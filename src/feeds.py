@@ -0,0 +1,116 @@
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+YT = '{http://www.youtube.com/xml/schemas/2015}'
+MEDIA = '{http://search.yahoo.com/mrss/}'
+
+def _iso_utc(text):
+    """'2024-01-05T16:00:01+00:00' -> naive UTC ISO string, same as feedparser's published_parsed."""
+    dt = datetime.fromisoformat(text.strip().replace('Z', '+00:00'))
+    if dt.tzinfo: dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.replace(microsecond=0).isoformat()
+
+def parse_youtube_feed(xml_data):
+    """Streaming parser for YouTube's feeds/videos.xml.
+
+    Only extracts the fields the refresh loop uses. Returns None if the
+    document is not a YouTube Atom feed (or is malformed), so the caller
+    can fall back to feedparser.
+    """
+    if isinstance(xml_data, str): xml_data = xml_data.encode('utf-8')
+    title = None
+    entries = []
+    entry = None
+    root = None
+    try:
+        for event, elem in ET.iterparse(io.BytesIO(xml_data), events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if root is None:
+                    root = elem
+                    if tag != ATOM + 'feed': return None
+                elif tag == ATOM + 'entry': entry = {}
+                continue
+
+            if entry is None:
+                if tag == ATOM + 'title' and title is None: title = elem.text or ''
+                continue
+
+            if tag == ATOM + 'entry':
+                if not entry.get('id'): return None  # No yt:videoId, not a YouTube feed
+                if entry.get('published'):
+                    entry_title = entry.get('title', '')
+                    entries.append({
+                        'id': entry['id'], 'title': entry_title, 'link': entry.get('link', ''),
+                        'published': _iso_utc(entry['published']),
+                        'is_shorts': "#shorts" in entry_title.lower() or "#shorts" in entry.get('summary', '').lower(),
+                        'duration': entry.get('duration')
+                    })
+                entry = None
+                root.remove(elem)
+            elif tag == YT + 'videoId': entry['id'] = elem.text
+            elif tag == ATOM + 'title': entry['title'] = elem.text or ''
+            elif tag == ATOM + 'link':
+                if elem.get('rel', 'alternate') == 'alternate': entry['link'] = elem.get('href')
+            elif tag == ATOM + 'published': entry['published'] = elem.text
+            elif tag == MEDIA + 'description': entry['summary'] = elem.text or ''
+            elif tag == MEDIA + 'content':
+                if elem.get('duration'): entry['duration'] = elem.get('duration')
+    except (ET.ParseError, ValueError):
+        return None
+    if title is None: return None
+    return {'title': title, 'entries': entries}
+
+def extract_feed(d):
+    """Reduces a FeedParserDict to the plain, JSON-serializable fields the refresh loop uses."""
+    entries = []
+    for entry in d.entries:
+        if not entry.get('published_parsed'): continue
+        vid_id = entry.get('id', entry.link)
+        if vid_id.startswith('yt:video:'): vid_id = vid_id.replace('yt:video:', '')
+
+        # Some RSS parsers/feeds include duration in media_group or media_content
+        duration = None
+        media_group = entry.get('media_group', {})
+        if 'duration' in media_group:
+            duration = media_group['duration']
+        elif 'media_content' in entry and len(entry['media_content']) > 0:
+            duration = entry['media_content'][0].get('duration')
+
+        entries.append({
+            'id': vid_id, 'title': entry.title, 'link': entry.link,
+            'published': datetime(*entry.published_parsed[:6]).isoformat(),
+            'is_shorts': "#shorts" in entry.title.lower() or "#shorts" in entry.get('summary', '').lower(),
+            'duration': duration
+        })
+    return {'title': d.feed.get('title', 'Unknown'), 'entries': entries}
+
+def parse_feed_generic(xml_data):
+    import feedparser  # Slow to import and only needed for non-YouTube feeds
+    return extract_feed(feedparser.parse(xml_data))
+
+def parse_feed(xml_data):
+    """YouTube fast path, feedparser for everything else."""
+    feed = parse_youtube_feed(xml_data)
+    if feed is None: feed = parse_feed_generic(xml_data)
+    return feed
+
+PARSE_MODES = ('thread', 'process', 'inline')
+
+def make_parse_executor(mode, workers=0):
+    """Executor for parse_feed. 'process' sidesteps the GIL on large subscription lists;
+    'inline' returns None and the caller parses on the event loop thread.
+
+    Process workers are spawned, not forked: by the first parse the app is
+    running its database, resolver and import threads, and forking a
+    multi-threaded process can deadlock the child."""
+    workers = workers or os.cpu_count() or 1
+    if mode == 'process':
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    if mode == 'thread': return ThreadPoolExecutor(max_workers=workers)
+    return None
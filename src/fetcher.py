@@ -0,0 +1,88 @@
+import asyncio
+import random
+from collections import namedtuple
+from urllib.parse import urlsplit
+import aiohttp
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_BACKOFF = 30.0
+
+# status: 'ok', 'not_modified', 'http_error', 'timeout' or 'error'
+FetchResult = namedtuple('FetchResult', 'url status http_status body etag last_modified attempts error')
+
+class FeedFetcher:
+    """Pooled HTTP client for feed refreshes.
+
+    One tuned session per refresh, a concurrency cap per host, total/connect
+    timeouts and exponential backoff with jitter on 429/5xx and network errors.
+    """
+    def __init__(self, user_agent, max_connections=20, per_host=6, total_timeout=20,
+                 connect_timeout=5, retries=3, backoff=0.5):
+        self.user_agent = user_agent
+        self.max_connections = max_connections
+        self.per_host = per_host
+        self.timeout = aiohttp.ClientTimeout(total=total_timeout, connect=connect_timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.session = None
+        self.host_limits = {}
+
+    @classmethod
+    def from_config(cls, cfg, user_agent):
+        return cls(user_agent,
+                   max_connections=cfg.get_int('Network', 'max_connections'),
+                   per_host=cfg.get_int('Network', 'per_host_connections'),
+                   total_timeout=cfg.get_float('Network', 'total_timeout'),
+                   connect_timeout=cfg.get_float('Network', 'connect_timeout'),
+                   retries=cfg.get_int('Network', 'retries'),
+                   backoff=cfg.get_float('Network', 'backoff'))
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.per_host,
+                                         ttl_dns_cache=300, keepalive_timeout=30)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout,
+                                             headers={"User-Agent": self.user_agent})
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+        self.session = None
+
+    def _host_limit(self, url):
+        host = urlsplit(url).netloc
+        if host not in self.host_limits:
+            self.host_limits[host] = asyncio.Semaphore(self.per_host)
+        return self.host_limits[host]
+
+    def _delay(self, attempt, retry_after=None):
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), MAX_BACKOFF)
+        return min(self.backoff * (2 ** attempt), MAX_BACKOFF) * random.uniform(0.5, 1.5)
+
+    async def fetch(self, url, headers=None):
+        """GET with retries. Never raises; the outcome is in FetchResult.status."""
+        result = None
+        for attempt in range(self.retries + 1):
+            retry_after = None
+            try:
+                async with self._host_limit(url):
+                    async with self.session.get(url, headers=headers) as resp:
+                        etag, last_modified = resp.headers.get('ETag'), resp.headers.get('Last-Modified')
+                        if resp.status == 304:
+                            return FetchResult(url, 'not_modified', 304, None, etag, last_modified, attempt + 1, None)
+                        if resp.status == 200:
+                            body = await resp.read()
+                            return FetchResult(url, 'ok', 200, body, etag, last_modified, attempt + 1, None)
+                        result = FetchResult(url, 'http_error', resp.status, None, None, None, attempt + 1, f"HTTP {resp.status}")
+                        if resp.status not in RETRY_STATUSES: return result
+                        retry_after = resp.headers.get('Retry-After')
+            except asyncio.TimeoutError:
+                result = FetchResult(url, 'timeout', None, None, None, None, attempt + 1, "timeout")
+            except aiohttp.ClientError as e:
+                result = FetchResult(url, 'error', None, None, None, None, attempt + 1, str(e) or type(e).__name__)
+            except Exception as e:
+                return FetchResult(url, 'error', None, None, None, None, attempt + 1, str(e) or type(e).__name__)
+
+            if attempt < self.retries:
+                await asyncio.sleep(self._delay(attempt, retry_after))
+        return result
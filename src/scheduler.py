@@ -0,0 +1,131 @@
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+class RefreshScheduler:
+    """Refreshes feeds in the background while the TUI is open.
+
+    Each feed gets its own poll interval derived from how often the channel
+    uploads: a quarter of the typical gap between its recent videos (or of
+    the time since its last one, for channels that went quiet), clamped to
+    [min_interval, max_interval] seconds. Consumers watch `generation` to
+    know when new entries have been merged into the store, and
+    refreshed_since() to know which feeds they came from.
+
+    A feed that fails to refresh is retried sooner, after retry_interval
+    seconds doubling with each consecutive failure, but never later than
+    its normal interval.
+    """
+    def __init__(self, refresh, upload_times, min_interval=900, max_interval=43200, auto=True, retry_interval=60):
+        self.refresh = refresh            # async (urls) -> (summary line, URLs that failed)
+        self.upload_times = upload_times  # async (url) -> ISO published dates, newest first
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.retry_interval = retry_interval
+        self.auto = auto
+        self.due = {}
+        self.intervals = {}
+        self.failures = {}  # url -> consecutive failed refreshes
+        self.generation = 0
+        self.refreshed = deque(maxlen=16)  # (generation, urls) of recent refreshes
+        self.summary = None
+        self.lock = asyncio.Lock()
+        self.wake = asyncio.Event()
+        self.task = None
+
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+
+    def set_feeds(self, feeds):
+        """New feeds are due immediately, removed ones are forgotten."""
+        now = time.monotonic()
+        for url in feeds:
+            self.due.setdefault(url, now)
+        for url in set(self.due) - set(feeds):
+            del self.due[url]
+            self.intervals.pop(url, None)
+            self.failures.pop(url, None)
+        self.wake.set()
+
+    @property
+    def busy(self):
+        return self.lock.locked() or any(t <= time.monotonic() for t in self.due.values())
+
+    async def interval_for(self, url):
+        try:
+            times = [datetime.fromisoformat(t) for t in await self.upload_times(url) if t]
+        except Exception:
+            times = []
+        if len(times) < 2: return self.max_interval
+        times.sort(reverse=True)
+        gaps = sorted((a - b).total_seconds() for a, b in zip(times, times[1:]))
+        typical_gap = gaps[len(gaps) // 2]
+        since_last = (datetime.now(timezone.utc).replace(tzinfo=None) - times[0]).total_seconds()
+        return min(max(max(typical_gap, since_last) / 4, self.min_interval), self.max_interval)
+
+    def _retry_delay(self, url):
+        failures = self.failures.get(url, 0) + 1
+        self.failures[url] = failures
+        interval = self.intervals.get(url, self.max_interval)
+        return min(self.retry_interval * 2 ** min(failures - 1, 16), interval)
+
+    def _reschedule(self, url, delay):
+        self.due[url] = time.monotonic() + delay if self.auto else float('inf')
+
+    async def refresh_urls(self, urls):
+        async with self.lock:
+            try:
+                summary, failed = await self.refresh(urls)
+            except Exception as e:
+                summary, failed = f"Refresh failed: {e}", set(urls)
+            self.summary = f"{summary} ({datetime.now().strftime('%H:%M')})"
+            for url in urls:
+                if url not in self.due: continue
+                self.intervals[url] = await self.interval_for(url)
+                if url in failed:
+                    self._reschedule(url, self._retry_delay(url))
+                else:
+                    self.failures.pop(url, None)
+                    self._reschedule(url, self.intervals[url])
+            self.generation += 1
+            self.refreshed.append((self.generation, list(urls)))
+
+    def refreshed_since(self, generation):
+        """URLs refreshed after `generation`, or None if that is too far back to tell."""
+        if generation == self.generation: return []
+        if not self.refreshed or self.refreshed[0][0] > generation + 1: return None
+        urls = []
+        for gen, gen_urls in self.refreshed:
+            if gen > generation: urls += gen_urls
+        return list(dict.fromkeys(urls))
+
+    async def refresh_now(self):
+        await self.refresh_urls(list(self.due))
+
+    async def _run(self):
+        while True:
+            now = time.monotonic()
+            due = [url for url, t in self.due.items() if t <= now]
+            if due:
+                try:
+                    await self.refresh_urls(due)
+                except Exception as e:
+                    # Keep refreshing in the background; the error shows up as the dashboard's status line
+                    self.summary = f"Background refresh failed: {e} ({datetime.now().strftime('%H:%M')})"
+                    for url in due:
+                        if url in self.due: self._reschedule(url, self._retry_delay(url))
+                continue
+            next_due = min(self.due.values(), default=float('inf'))
+            timeout = None if next_due == float('inf') else max(next_due - now, 1)
+            self.wake.clear()
+            try:
+                await asyncio.wait_for(self.wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,83 @@
+from collections import defaultdict
+
+MAX_CANDIDATES = 2000  # Rows scored per query, at most
+
+def _normalize(text):
+    return " ".join((text or "").casefold().split())
+
+def _find(text, word):
+    """Position of `word` in `text`; words under three characters only match at a word start."""
+    if len(word) > 2: return text.find(word)
+    if text.startswith(word): return 0
+    pos = text.find(" " + word)
+    return pos + 1 if pos >= 0 else -1
+
+class SearchIndex:
+    """Inverted index over row texts, for search-as-you-type over long lists.
+
+    Rows are indexed by word, and the (much smaller) vocabulary by trigram
+    and by 1-2 character prefix. A query is split into words and every word
+    must occur in a row: words of three or more characters match inside
+    any row word, shorter ones only at a word start. Only the rows holding
+    matching words become candidates, at most `max_candidates` of them are
+    scored. Matches at word starts and earlier in the text rank first; ties
+    keep the original row order. The index is built on the first search.
+    """
+    def __init__(self, texts, max_candidates=MAX_CANDIDATES):
+        self.source = texts
+        self.max_candidates = max_candidates
+        self.texts = None
+        self.postings = None
+        self.trigrams = None
+        self.prefixes = None
+
+    def _build(self):
+        self.texts = [_normalize(text) for text in self.source]
+        self.postings = defaultdict(list)  # word -> row ids, ascending
+        for row, text in enumerate(self.texts):
+            for word in set(text.split()):
+                self.postings[word].append(row)
+        self.trigrams = defaultdict(set)  # trigram -> words containing it
+        self.prefixes = defaultdict(set)  # 1-2 character prefix -> words starting with it
+        for word in self.postings:
+            for i in range(len(word) - 2):
+                self.trigrams[word[i:i + 3]].add(word)
+            self.prefixes[word[:1]].add(word)
+            if len(word) > 1: self.prefixes[word[:2]].add(word)
+
+    def _rows_for(self, query_word):
+        if len(query_word) < 3:
+            words = self.prefixes.get(query_word, ())
+        else:
+            grams = sorted((self.trigrams.get(query_word[i:i + 3], set()) for i in range(len(query_word) - 2)), key=len)
+            words = [word for word in grams[0] if query_word in word]
+        rows = set()
+        for word in words:
+            rows.update(self.postings[word])
+        return rows
+
+    def search(self, query, limit=None):
+        """Row ids matching every word of `query`, best first."""
+        if self.texts is None: self._build()
+        words = _normalize(query).split()
+        if not words: return list(range(len(self.texts)))[:limit]
+
+        candidates = None
+        for word in sorted(set(words), key=len, reverse=True):  # Longest (most selective) first
+            rows = self._rows_for(word)
+            candidates = rows if candidates is None else candidates & rows
+            if not candidates: return []
+        if len(candidates) > self.max_candidates:
+            candidates = sorted(candidates)[:self.max_candidates]
+
+        scored = []
+        for row in candidates:
+            text = self.texts[row]
+            score = 0
+            for word in words:
+                pos = _find(text, word)
+                # A match at a word start beats one inside a word, then earlier beats later
+                score += pos if pos == 0 or text[pos - 1] == " " else 1000 + pos
+            scored.append((score, row))
+        scored.sort()
+        return [row for _, row in scored[:limit]]
@@ -0,0 +1,37 @@
+import time
+
+class StartupProfile:
+    """Wall-clock marks from the first line of ytrss.py to the first painted dashboard.
+
+    Each mark records the time since the previous one, so the report reads
+    as a breakdown of where cold start goes (imports, config, database,
+    first paint). Marks are cheap and always taken up to the first paint;
+    the report is printed with --profile-startup.
+    """
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.marks = []
+        self.painted = False
+
+    def mark(self, label):
+        if self.painted: return
+        now = time.perf_counter()
+        self.marks.append((label, now - self.last))
+        self.last = now
+
+    def first_paint(self):
+        """Last mark; later ones (e.g. on the next dashboard loop) are ignored."""
+        self.mark("first paint")
+        self.painted = True
+
+    @property
+    def total(self):
+        return self.last - self.start
+
+    def report(self):
+        lines = [f"{seconds * 1000:8.1f} ms  {label}" for label, seconds in self.marks]
+        lines.append(f"{self.total * 1000:8.1f} ms  total (to first paint)")
+        return "\n".join(lines)
+
+startup = StartupProfile()
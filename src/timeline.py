@@ -0,0 +1,49 @@
+import heapq
+from itertools import islice
+
+def _published(video):
+    return video['published'] or ""
+
+def merge_timelines(lists):
+    """Lazily merges newest-first video lists into one newest-first stream (k-way heap merge)."""
+    return heapq.merge(*lists, key=_published, reverse=True)
+
+class Timeline:
+    """The newest `limit` videos across all channels, kept newest first.
+
+    Built by merging the per-channel lists, which are already date-ordered,
+    instead of sorting every entry. Entries from a partial refresh are
+    merged into the existing top-N, replacing every row of the refreshed
+    feeds (videos carry their feed URL under 'feed').
+    """
+    def __init__(self, limit=60):
+        self.limit = limit
+        self.items = []
+
+    @classmethod
+    def from_channels(cls, videos_by_channel, limit=60):
+        timeline = cls(limit)
+        timeline.items = list(islice(merge_timelines(videos_by_channel.values()), limit))
+        return timeline
+
+    def merge(self, videos, feeds=()):
+        """Merges newest-first `videos`, the current entries of `feeds`, in place of those feeds' rows.
+
+        Only the first `limit` of `videos` can make the cut. Returns False
+        if rows that left a feed's window opened gaps the top-N can't fill
+        from `videos` alone (other channels' rows below the old cutoff may
+        belong there); rebuild it with from_channels() then.
+        """
+        videos = list(islice(videos, self.limit))
+        feeds = set(feeds)
+        ids = {v['id'] for v in videos}
+        cutoff = _published(self.items[-1]) if len(self.items) == self.limit else None
+        kept = [v for v in self.items if v['id'] not in ids and v.get('feed') not in feeds]
+        self.items = list(islice(heapq.merge(kept, videos, key=_published, reverse=True), self.limit))
+        return cutoff is None or (len(self.items) == self.limit and _published(self.items[-1]) >= cutoff)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import os
 
@@ -8,11 +9,15 @@ try:
     from rich.console import Console
     from rich.style import Style
     from rich.panel import Panel
+    from pfzy import fuzzy_match
 except ImportError:
     print("Error: Missing dependencies.")
     print("Please install requirements: pip install -r requirements.txt")
     sys.exit(1)
 
+from src.utils import LRUCache, clear_screen
+from src.search import SearchIndex
+
 # Keybindings mapping 'escape' to 'interrupt'
 # 'q' is removed to allow searching for words with 'q'
 kb_select = {
@@ -23,6 +28,23 @@ kb_input_esc = {
     "interrupt": [{"key": "escape"}]
 }
 
+class RowCache:
+    """Memoized menu rows (labels or whole Choices).
+
+    The key holds everything the row shows (e.g. a video's id, seen, shorts
+    and duration state), so a row is only rendered again when that changes.
+    """
+    def __init__(self, render, maxsize=10000):
+        self.render = render
+        self.rows = LRUCache(maxsize)
+
+    def get(self, key, *args):
+        row = self.rows.get(key)
+        if row is None:
+            row = self.render(*args)
+            self.rows.put(key, row)
+        return row
+
 async def ui_select(message, choices, **kwargs):
     kwargs.setdefault("instruction", "[Esc] Back")
     try:
@@ -38,6 +60,42 @@ async def ui_select(message, choices, **kwargs):
     except KeyboardInterrupt:
         return None
 
+INDEXED_SEARCH_ROWS = 300  # From this many choices on, ui_filter searches through a SearchIndex
+SEARCH_RESULTS = 200  # Rows shown for an indexed search
+
+def use_search_index(prompt, index, row_choice, limit=SEARCH_RESULTS, extra=()):
+    """Makes a fuzzy prompt answer its search box from `index` instead of rescoring every choice.
+
+    row_choice(row) -> Choice for an index row; `extra` Choices are listed after the results.
+    Queries no row word matches (e.g. "lnx" for "Linux") fall back to fzy
+    scoring over the index texts, as the unindexed prompt would.
+    """
+    control = prompt.content_control
+    unfiltered = control.choices
+    haystack = []
+
+    async def fuzzy_rows(text, wait_time):
+        await asyncio.sleep(wait_time)  # Debounced like the stock filter; typing on cancels it
+        if not haystack: haystack.extend({"name": t, "row": row} for row, t in enumerate(index.source))
+        return [match["row"] for match in (await fuzzy_match(text, haystack, key="name"))[:limit]]
+
+    async def filter_choices(wait_time):
+        # No debounce for index lookups: one is cheaper than the wait
+        text = control._current_text()
+        if not text:
+            choices = unfiltered
+        else:
+            rows = index.search(text, limit) or await fuzzy_rows(text, wait_time)
+            results = [row_choice(row) for row in rows] + list(extra)
+            choices = [{"name": c.name, "value": c.value, "enabled": False, "index": n, "indices": []}
+                       for n, c in enumerate(results)]
+        # The prompt would only swap in the filtered list when this task's callback runs; a redraw
+        # before that would index the new choices with the old list, so both change here, together
+        control.choices = control._filtered_choices = choices
+        if text: control.selected_choice_index = 0  # Best match
+        return choices
+    control._filter_choices = filter_choices
+
 async def ui_filter(message, choices, **kwargs):
     """Fuzzy search select for filtering lists."""
     kwargs.setdefault("instruction", "[Type to Search] [Esc] Back")
@@ -46,17 +104,98 @@ async def ui_filter(message, choices, **kwargs):
     clean_choices = [c for c in choices if not isinstance(c, Separator)]
     
     try:
-        return await inquirer.fuzzy(
+        prompt = inquirer.fuzzy(
             message=message,
             choices=clean_choices,
             keybindings=kb_select,
             qmark="",
             amark="",
             **kwargs
-        ).execute_async()
+        )
+        if len(clean_choices) >= INDEXED_SEARCH_ROWS:
+            use_search_index(prompt, SearchIndex([c.name for c in clean_choices]), clean_choices.__getitem__)
+        return await prompt.execute_async()
     except KeyboardInterrupt:
         return None
 
+PAGE_SIZE = 120  # Rows materialized at once by ui_paged_filter
+PAGE_MARGIN = 20  # Rows kept on the far side of the cursor when the window slides
+MORE_ABOVE = "__more_above__"
+MORE_BELOW = "__more_below__"
+
+async def ui_paged_filter(message, count, render, cursor=0, footer=(), index=None,
+                          page_size=PAGE_SIZE, margin=PAGE_MARGIN, **kwargs):
+    """ui_filter over `count` rows that only materializes a window of them.
+
+    render(i) -> label of row i, for the rows in the window only. Moving the
+    cursor past either end of the window (or PgUp/PgDn) slides it and reopens
+    the prompt there, keeping the search text. `footer` choices are always
+    shown below the window. With a SearchIndex over the rows, typing searches
+    all of them rather than the window. Returns the row index, a footer
+    value or None.
+    """
+    kwargs.setdefault("instruction", "[Type to Search] [PgUp/PgDn] Page [Esc] Back")
+    kwargs.setdefault("cycle", False)
+    cursor = min(max(cursor, 0), max(count - 1, 0))
+    start = max(cursor - margin, 0)
+    search = ""
+    while True:
+        end = min(start + page_size, count)
+        choices = []
+        if start > 0: choices.append(Choice(MORE_ABOVE, name=f"  ▲ {start} more"))
+        choices += [Choice(i, name=render(i)) for i in range(start, end)]
+        if end < count: choices.append(Choice(MORE_BELOW, name=f"  ▼ {count - end} more"))
+        choices += list(footer)
+
+        prompt = inquirer.fuzzy(message=message, choices=choices, keybindings=kb_select,
+                                qmark="", amark="", default=search, **kwargs)
+        prompt.content_control.selected_choice_index = cursor - start + (1 if start > 0 else 0)
+        if index is not None:
+            use_search_index(prompt, index, lambda i: Choice(i, name=render(i)), extra=footer)
+        current = lambda: prompt.content_control.selection["value"] if prompt.content_control.choice_count else None
+        searching = lambda: bool(prompt._buffer.text)
+
+        # Stepping past either end of the window slides it instead of stopping or wrapping
+        def slide_or(action, result, at_edge):
+            original = prompt.kb_func_lookup[action]
+            def handler(event, *args):
+                if at_edge(): return event.app.exit(result=result)
+                for method in original: method["func"](event, *method.get("args", []))
+            return [{"func": handler}]
+        prompt.kb_func_lookup = {
+            "down": slide_or("down", MORE_BELOW, lambda: not searching() and end < count and current() in (end - 1, MORE_BELOW)),
+            "up": slide_or("up", MORE_ABOVE, lambda: not searching() and start > 0 and current() in (start, MORE_ABOVE)),
+        }
+
+        @prompt.register_kb("pagedown")
+        def _(event):
+            if not searching(): event.app.exit(result=("page", page_size - 2 * margin))
+
+        @prompt.register_kb("pageup")
+        def _(event):
+            if not searching(): event.app.exit(result=("page", 2 * margin - page_size))
+
+        try:
+            result = await prompt.execute_async()
+        except KeyboardInterrupt:
+            return None
+
+        position = current()
+        if not isinstance(position, int) or position < 0: position = cursor
+        search = prompt._buffer.text  # Carried over to the next window (the prompt has no public accessor)
+        if result == MORE_BELOW:
+            cursor = end
+            start = max(cursor - margin, 0)
+        elif result == MORE_ABOVE:
+            cursor = start - 1
+            start = max(cursor - page_size + margin + 1, 0)
+        elif isinstance(result, tuple):
+            cursor = min(max(position + result[1], 0), count - 1)
+            start = max(cursor - margin, 0) if result[1] > 0 else max(cursor - page_size + margin + 1, 0)
+        else:
+            return result
+        clear_screen()
+
 async def ui_text(message, **kwargs):
     try:
         return await inquirer.text(message=message, keybindings=kb_input_esc, **kwargs).execute_async()
@@ -1,9 +1,12 @@
+import asyncio
 import platform
 import subprocess
 import shutil
 import os
 import unicodedata
 import sys
+from collections import OrderedDict
+from functools import lru_cache
 from rich.console import Console
 
 console = Console()
@@ -35,21 +38,53 @@ def clipboard_copy(text):
 def clear_screen():
     os.system('cls' if platform.system() == 'Windows' else 'clear')
 
+class _CleanTable(dict):
+    """str.translate table for clean_title, filled in per code point on first use.
+
+    Astral characters (emoji etc.) are dropped, other control/symbol
+    characters become spaces, everything else maps to itself.
+    """
+    def __missing__(self, code):
+        char = chr(code)
+        if code > 0xFFFF: repl = None
+        elif unicodedata.category(char).startswith(('C', 'S')) and char not in "$-+/%": repl = " "
+        else: repl = code
+        self[code] = repl
+        return repl
+
+_clean_table = _CleanTable()
+
+@lru_cache(maxsize=8192)
 def clean_title(text):
     """Removes emojis and other characters that cause terminal rendering glitches."""
     if not text: return ""
-    text = unicodedata.normalize('NFKC', text)
-    cleaned = []
-    for char in text:
-        if ord(char) > 0xFFFF: continue
-        category = unicodedata.category(char)
-        if category.startswith(('C', 'S')):
-            if char in "$-+/%": cleaned.append(char)
-            else: cleaned.append(" ")
-        else:
-            cleaned.append(char)
-    text = "".join(cleaned)
-    return " ".join(text.split())
+    # NFKC leaves ASCII unchanged
+    if not text.isascii(): text = unicodedata.normalize('NFKC', text)
+    return " ".join(text.translate(_clean_table).split())
+
+def parse_duration(text):
+    """'1:02:03' / '2:03' / '123' (plain seconds) -> total seconds, or None if unknown."""
+    if not text: return None
+    try:
+        total = 0
+        for part in str(text).split(':'):
+            total = total * 60 + int(float(part))
+        return total
+    except ValueError:
+        return None
+
+def is_short_duration(seconds):
+    """Shorts run at most a minute."""
+    return seconds is not None and seconds <= 60
+
+async def import_in_background(load):
+    """Runs `load` on a worker thread and returns the module it imports, so a heavy first
+    import doesn't stall the event loop.
+
+    `load` holds a plain import statement rather than a module name, so
+    PyInstaller's analysis still finds the module for the one-file build.
+    """
+    return await asyncio.to_thread(load)
 
 def get_resource_path(relative_path):
     try:
@@ -57,3 +92,40 @@ def get_resource_path(relative_path):
     except:
         base_path = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base_path, relative_path)
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used key. Counts hits and misses."""
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        try:
+            value = self.data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key, default=None):
+        """Like get(), but neither counted nor marked as recently used."""
+        return self.data.get(key, default)
+
+    def put(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        return self.data.pop(key, default)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __len__(self):
+        return len(self.data)
@@ -1,24 +1,32 @@
 #!/usr/bin/env python3
-import feedparser
+from src.startup import startup
+import argparse
 import subprocess
 import sys
 import os
-import shutil
-import sqlite3
 import asyncio
-import aiohttp
-import webbrowser
-import unicodedata
 import json
-import platform
-import re
 import xml.etree.ElementTree as ET
-import configparser
-from src.config import ConfigManager
-from src.database import DatabaseManager
-from src.utils import clipboard_copy, clear_screen, clean_title, get_resource_path
-from src.ui import ui_select, ui_filter, ui_text, Choice, Separator, Console, Panel, Style, inquirer
+import multiprocessing
+import signal
+import sqlite3
+from itertools import groupby
 from datetime import datetime
+startup.mark("stdlib imports")
+# rich and InquirerPy draw the first screen; aiohttp, feedparser and webbrowser are imported where first used
+from src.ui import ui_select, ui_filter, ui_paged_filter, ui_text, RowCache, Choice, Separator, Console, Panel, Style, inquirer
+startup.mark("rich, InquirerPy (src.ui)")
+from src.config import ConfigManager
+from src.database import DatabaseManager, fts_match
+from src.feeds import parse_feed, make_parse_executor, PARSE_MODES
+from src.scheduler import RefreshScheduler
+from src.timeline import Timeline, merge_timelines
+from src.search import SearchIndex
+from src.durations import DurationResolver, DurationPrefetcher, format_seconds
+from src.asyncdb import AsyncDatabase
+from src.daemon import DaemonServer, DaemonClient, DaemonError, RemoteScheduler
+from src.utils import clipboard_copy, clear_screen, clean_title, get_resource_path, parse_duration, is_short_duration, import_in_background
+startup.mark("app modules")
 
 # Reduce Esc key delay (prevents lag when pressing Esc)
 os.environ.setdefault('ESCDELAY', '25')
@@ -31,6 +39,18 @@ CONFIG_DIR = os.path.expanduser("~/.config/ytrss")
 OPML_FILE = os.path.join(CONFIG_DIR, "ytRss.opml")
 DB_FILE = os.path.join(CONFIG_DIR, "ytrss.db")
 CONF_FILE = os.path.join(CONFIG_DIR, "ytrss.conf")
+SOCKET_FILE = os.path.join(CONFIG_DIR, "ytrss.sock")  # `ytrss.py daemon` listens here
+FEED_WINDOW = 15  # Entries per channel shown on the dashboard (YouTube's RSS window)
+ALL_VIDEOS_LIMIT = None  # Rows in the All Videos timeline (None: every stored entry; the list is windowed)
+PREFETCH_TOP_N = 60  # All Videos rows whose durations are prefetched first
+LENGTH_VIEW_LIMIT = 200  # Rows per length filter view
+SEARCH_LIMIT = 200  # Rows returned by a history search
+SEARCH_RANKED_MATCHES = 5000  # Broader searches list the most recently stored matches instead of ranking them all
+# Dashboard length filters: key -> (label, min seconds, max seconds), bounds inclusive
+LENGTH_VIEWS = {
+    'short': ("Under 10 minutes", 0, 599),
+    'long': ("Longer than 1 hour", 3601, None),
+}
 USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36"
 
 # Create config directory if it doesn't exist
@@ -38,35 +58,60 @@ os.makedirs(CONFIG_DIR, exist_ok=True)
 cfg = ConfigManager(CONF_FILE)
 
 # Global state
-duration_cache = {}
 SHOW_SHORTS = cfg.get_bool('General', 'show_shorts')
+parse_executor = None
 
 db = DatabaseManager(DB_FILE)
+# Coroutines go through adb; the sync helpers below run on its database thread via adb.run()
+adb = AsyncDatabase(db)
+resolver = DurationResolver(adb, USER_AGENT, failure_ttl=cfg.get_int('Network', 'duration_retry_hours') * 3600,
+                            max_scan_bytes=cfg.get_int('Network', 'duration_scan_kb') * 1024,
+                            cache_size=cfg.get_int('General', 'duration_cache_size'))
+prefetcher = DurationPrefetcher(resolver, concurrency=cfg.get_int('Refresh', 'prefetch_concurrency'))
+backend = None  # Where the TUI gets its data: LocalBackend, or RemoteBackend with a daemon running
+startup.mark("config, database and resolver objects")
+
+SEEN_INSERT = "INSERT OR IGNORE INTO seen_videos (video_id, title, seen_date) VALUES (?, ?, ?)"
 
 def mark_as_seen(video_id, title):
-    db.execute("INSERT OR IGNORE INTO seen_videos (video_id, title, seen_date) VALUES (?, ?, ?)",
-               (video_id, title, datetime.now().isoformat()))
+    backend.mark_seen([(video_id, title, datetime.now().isoformat())])
 
 def mark_all_as_seen(videos):
     now = datetime.now().isoformat()
     data = [(v['id'], v['title'], now) for v in videos]
-    db.executemany("INSERT OR IGNORE INTO seen_videos (video_id, title, seen_date) VALUES (?, ?, ?)", data)
+    backend.mark_seen(data)
     console.print(f"Marked {len(videos)} videos as seen.", style="green")
 
-def get_seen_videos():
-    seen = set()
-    rows = db.fetchall("SELECT video_id FROM seen_videos")
-    for row in rows: seen.add(row[0])
-    return seen
+def days_ago(days):
+    return datetime.fromtimestamp(datetime.now().timestamp() - days * 86400).isoformat()
 
-def get_cached_metadata():
-    metadata = {}
-    rows = db.fetchall("SELECT video_id, duration FROM video_metadata")
-    for row in rows: metadata[row[0]] = row[1]
-    return metadata
+def compact_store(history_days, seen_days):
+    """Bounds the entry store and the seen-marks; either limit can be 0 (keep forever).
 
-def save_metadata(video_id, duration):
-    db.execute("INSERT OR REPLACE INTO video_metadata (video_id, duration) VALUES (?, ?)", (video_id, duration))
+    Videos published more than history_days ago leave the store, with
+    their seen-marks, unless they are in a playlist or still inside their
+    feed's FEED_WINDOW. Marks of videos the store doesn't have (from before
+    it existed) go after seen_days. Titles already kept in `videos` are
+    dropped from the marks. A stored video always keeps its mark, since
+    its channel, the length views or history search can still list it.
+    """
+    with db.transaction():
+        if history_days > 0:
+            expired = db.fetchall('''SELECT video_id FROM videos v
+                                    WHERE published_date < ?
+                                      AND NOT EXISTS (SELECT 1 FROM playlist_items pi WHERE pi.video_id = v.video_id)
+                                      AND v.rowid NOT IN (
+                                          SELECT w.rowid FROM videos w WHERE w.feed_url = v.feed_url
+                                          ORDER BY w.published_date DESC LIMIT ?)''',
+                                  (days_ago(history_days), FEED_WINDOW))
+            db.executemany("DELETE FROM seen_videos WHERE video_id = ?", expired)
+            db.executemany("DELETE FROM videos WHERE video_id = ?", expired)
+        if seen_days > 0:
+            db.execute('''DELETE FROM seen_videos
+                         WHERE seen_date < ? AND NOT EXISTS (SELECT 1 FROM videos v WHERE v.video_id = seen_videos.video_id)''',
+                       (days_ago(seen_days),))
+        db.execute('''UPDATE seen_videos SET title = NULL
+                     WHERE title IS NOT NULL AND video_id IN (SELECT video_id FROM videos)''')
 
 def add_to_playlist(playlist_name, video):
     row = db.fetchone("SELECT id FROM playlists WHERE name = ?", (playlist_name,))
@@ -80,38 +125,168 @@ def add_to_playlist(playlist_name, video):
         else:
             pub_date = str(video['published'])
 
-    db.execute('''INSERT OR REPLACE INTO videos (video_id, title, channel, url, duration, is_shorts, published_date)
-                 VALUES (?, ?, ?, ?, ?, ?, ?)''',
-              (video['id'], video['title'], video.get('channel'), video['link'], 
-               video.get('duration'), video.get('is_shorts', False), pub_date))
-    
-    db.execute("INSERT OR IGNORE INTO playlist_items (playlist_id, video_id) VALUES (?, ?)",
-              (playlist_id, video['id']))
+    seconds = parse_duration(video.get('duration'))
+    try:
+        with db.transaction():
+            db.execute('''INSERT INTO videos (video_id, title, channel, url, duration, duration_seconds, is_shorts, published_date)
+                         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                         ON CONFLICT(video_id) DO UPDATE SET
+                            title = excluded.title, channel = excluded.channel, url = excluded.url,
+                            duration = COALESCE(excluded.duration, videos.duration),
+                            duration_seconds = COALESCE(excluded.duration_seconds, videos.duration_seconds),
+                            is_shorts = excluded.is_shorts, published_date = excluded.published_date''',
+                      (video['id'], video['title'], video.get('channel'), video['link'], 
+                       video.get('duration') if seconds is not None else None, seconds,
+                       video.get('is_shorts', False), pub_date))
+
+            db.execute("INSERT OR IGNORE INTO playlist_items (playlist_id, video_id) VALUES (?, ?)",
+                      (playlist_id, video['id']))
+    except sqlite3.Error as e:
+        console.print(f"DB Error: {e}", style="red")  # Rolled back: no video row without its playlist item
+        return False
     return True
 
 def get_playlist_videos(playlist_name):
     videos = []
-    rows = db.fetchall('''SELECT v.* FROM videos v
+    rows = db.fetchall('''SELECT v.*, EXISTS(SELECT 1 FROM seen_videos s WHERE s.video_id = v.video_id) AS is_seen
+                     FROM videos v
                      JOIN playlist_items pi ON v.video_id = pi.video_id
                      JOIN playlists p ON pi.playlist_id = p.id
                      WHERE p.name = ?
                      ORDER BY pi.added_at DESC''', (playlist_name,))
     for row in rows:
-        videos.append({
-            'id': row['video_id'],
-            'title': row['title'],
-            'link': row['url'],
-            'channel': row['channel'],
-            'duration': row['duration'],
-            'is_shorts': bool(row['is_shorts']),
-            'published': row['published_date'],
-            'is_seen': False
-        })
+        videos.append(video_from_row(row))
     return videos
 
-def get_all_playlists():
-    rows = db.fetchall("SELECT name, is_system_list FROM playlists ORDER BY is_system_list DESC, name ASC")
-    return [{"name": r['name'], "is_system": bool(r['is_system_list'])} for r in rows]
+def video_from_row(row):
+    """videos row (plus an is_seen column) -> video dict."""
+    return {
+        'id': row['video_id'], 'title': row['title'], 'link': row['url'],
+        'published': row['published_date'],
+        'channel': row['channel'], 'is_seen': bool(row['is_seen']),
+        'is_shorts': bool(row['is_shorts']) or is_short_duration(row['duration_seconds']),
+        'duration': row['duration'] or "??:??"
+    }
+
+def store_feed_entries(feed_url, feed):
+    """Upserts parsed feed entries into the persistent entry store (videos table).
+
+    Returns the entries that were not in the store yet.
+    """
+    ch_name = clean_title(feed['title'] or 'Unknown')
+    ids = [e['id'] for e in feed['entries']]
+    known = {row[0] for row in db.fetchall(
+        f"SELECT video_id FROM videos WHERE video_id IN ({','.join('?' * len(ids))})", ids)} if ids else set()
+    data = []
+    for e in feed['entries']:
+        # Feed durations are plain seconds; store them as seconds plus the usual display string
+        seconds = parse_duration(e.get('duration'))
+        duration = format_seconds(seconds) if seconds is not None else None
+        data.append((e['id'], e['title'], ch_name, e['link'], duration, seconds, e['is_shorts'], e['published'], feed_url))
+    db.executemany('''INSERT INTO videos (video_id, title, channel, url, duration, duration_seconds, is_shorts, published_date, feed_url)
+                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                     ON CONFLICT(video_id) DO UPDATE SET
+                        title = excluded.title, channel = excluded.channel, url = excluded.url,
+                        duration = COALESCE(videos.duration, excluded.duration),
+                        duration_seconds = COALESCE(videos.duration_seconds, excluded.duration_seconds),
+                        is_shorts = excluded.is_shorts OR videos.is_shorts,
+                        published_date = excluded.published_date, feed_url = excluded.feed_url''', data)
+    # Durations resolved before the entry reached the store
+    db.execute('''UPDATE videos SET
+                    duration = (SELECT m.duration FROM video_metadata m WHERE m.video_id = videos.video_id),
+                    duration_seconds = (SELECT m.duration_seconds FROM video_metadata m WHERE m.video_id = videos.video_id)
+                  WHERE feed_url = ? AND duration_seconds IS NULL AND video_id IN (
+                    SELECT video_id FROM video_metadata WHERE duration_seconds IS NOT NULL)''', (feed_url,))
+    return [e for e in feed['entries'] if e['id'] not in known]
+
+def load_stored_videos(feeds):
+    """Builds the channel map (newest first, FEED_WINDOW entries per feed) from the entry store."""
+    all_videos_by_channel = {}
+    # Each feed's window is read newest-first off idx_videos_feed_url, so older history is never visited;
+    # seen status is resolved per row through the seen_videos primary key
+    rows = db.fetchall('''SELECT v.*, EXISTS(SELECT 1 FROM seen_videos s WHERE s.video_id = v.video_id) AS is_seen
+                         FROM (SELECT DISTINCT value AS feed_url FROM json_each(?)) f
+                         JOIN videos v ON v.rowid IN (
+                            SELECT rowid FROM videos WHERE feed_url = f.feed_url
+                            ORDER BY published_date DESC LIMIT ?)
+                         ORDER BY v.feed_url, v.published_date DESC''', (json.dumps(list(feeds)), FEED_WINDOW))
+    for feed_url, feed_rows in groupby(rows, key=lambda row: row['feed_url']):
+        videos = [video_from_row(row) for row in feed_rows]
+        for video in videos: video['feed'] = feed_url
+        name = videos[0]['channel']
+        if name in all_videos_by_channel:
+            # Two feeds under one channel name
+            videos = list(merge_timelines([all_videos_by_channel[name], videos]))
+        all_videos_by_channel[name] = videos
+    return all_videos_by_channel
+
+def replace_feeds(all_videos_by_channel, changed, urls):
+    """Swaps the rows of the refreshed `urls` in the channel map for `changed` (load_stored_videos of them).
+
+    A feed's old rows go wherever they were listed, so entries that left its
+    window disappear and a renamed channel moves to its new name.
+    """
+    urls = set(urls)
+    for name, videos in list(all_videos_by_channel.items()):
+        if not any(v.get('feed') in urls for v in videos): continue
+        videos = [v for v in videos if v.get('feed') not in urls]
+        if videos: all_videos_by_channel[name] = videos
+        else: del all_videos_by_channel[name]
+    for name, videos in changed.items():
+        if name in all_videos_by_channel:
+            videos = list(merge_timelines([all_videos_by_channel[name], videos]))
+        all_videos_by_channel[name] = videos
+
+def get_videos_by_length(feeds, min_seconds, max_seconds, limit=LENGTH_VIEW_LIMIT):
+    """Newest stored videos of the subscribed feeds within a duration range, filtered by SQLite."""
+    rows = db.fetchall('''SELECT v.*, EXISTS(SELECT 1 FROM seen_videos s WHERE s.video_id = v.video_id) AS is_seen
+                         FROM videos v
+                         WHERE v.duration_seconds BETWEEN ? AND ?
+                           AND v.feed_url IN (SELECT value FROM json_each(?))
+                         ORDER BY v.published_date DESC LIMIT ?''',
+                       (min_seconds, max_seconds if max_seconds is not None else 2 ** 62, json.dumps(list(feeds)), limit))
+    return [video_from_row(row) for row in rows]
+
+def search_history(query, limit=SEARCH_LIMIT):
+    """Stored videos matching every word of `query` (as prefixes), best first, through the FTS5 index.
+
+    Up to SEARCH_RANKED_MATCHES matches are ranked by bm25; past that the
+    most recently stored ones come first. Titles only known from seen-marks
+    (videos never kept in `videos`) follow.
+    """
+    if not query.split(): return []
+    seen = "EXISTS(SELECT 1 FROM seen_videos s WHERE s.video_id = v.video_id) AS is_seen"
+    if not db.has_fts:
+        pattern = f"%{query.strip()}%"
+        rows = db.fetchall(f'''SELECT v.*, {seen} FROM videos v WHERE v.title LIKE ? OR v.channel LIKE ?
+                             ORDER BY v.published_date DESC LIMIT ?''', (pattern, pattern, limit))
+        return [video_from_row(row) for row in rows]
+    match = fts_match(query)
+    # Counting is cheap, scoring every match of a common word is not
+    count = db.fetchone("SELECT count(*) FROM (SELECT 1 FROM videos_fts WHERE videos_fts MATCH ? LIMIT ?)",
+                        (match, SEARCH_RANKED_MATCHES + 1))
+    order = "videos_fts.rowid DESC" if count and count[0] > SEARCH_RANKED_MATCHES else "videos_fts.rank"
+    rows = db.fetchall(f'''SELECT v.*, {seen} FROM videos_fts JOIN videos v ON v.rowid = videos_fts.rowid
+                         WHERE videos_fts MATCH ? ORDER BY {order} LIMIT ?''', (match, limit))
+    if len(rows) < limit:
+        rows += db.fetchall('''SELECT s.video_id, s.title, 'https://www.youtube.com/watch?v=' || s.video_id AS url,
+                                    s.seen_date AS published_date, '' AS channel, 1 AS is_seen, 0 AS is_shorts,
+                                    NULL AS duration, NULL AS duration_seconds
+                             FROM seen_fts JOIN seen_videos s ON s.rowid = seen_fts.rowid
+                             WHERE seen_fts MATCH ? AND s.video_id NOT IN (SELECT video_id FROM videos)
+                             ORDER BY seen_fts.rank LIMIT ?''', (match, limit - len(rows)))
+    return [video_from_row(row) for row in rows]
+
+def get_all_playlists(with_counts=False):
+    if not with_counts:
+        rows = db.fetchall("SELECT name, is_system_list FROM playlists ORDER BY is_system_list DESC, name ASC")
+        return [{"name": r['name'], "is_system": bool(r['is_system_list'])} for r in rows]
+    # One aggregated query for the dashboard instead of loading every playlist
+    rows = db.fetchall('''SELECT p.name, p.is_system_list, COUNT(pi.video_id) AS count
+                         FROM playlists p LEFT JOIN playlist_items pi ON pi.playlist_id = p.id
+                         GROUP BY p.id
+                         ORDER BY p.is_system_list DESC, p.name ASC''')
+    return [{"name": r['name'], "is_system": bool(r['is_system_list']), "count": r['count']} for r in rows]
 
 def create_playlist(name):
     try:
@@ -120,56 +295,30 @@ def create_playlist(name):
     except:
         return False
 
+def delete_playlist(name):
+    db.execute("DELETE FROM playlists WHERE name = ?", (name,))
+
 def remove_from_playlist(playlist_name, video_id):
     db.execute('''DELETE FROM playlist_items 
                  WHERE video_id = ? AND playlist_id = (SELECT id FROM playlists WHERE name = ?)''',
               (video_id, playlist_name))
     return True
 
-async def get_video_duration(video_url, video_id):
-    if video_id in duration_cache and duration_cache[video_id] != "??:??":
-        return duration_cache[video_id]
-    
-    # Try light-weight HTML scrap first
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(video_url, headers={"User-Agent": USER_AGENT}, timeout=5) as resp:
-                if resp.status == 200:
-                    html = await resp.text()
-                    # Look for <meta itemprop="duration" content="PT3M45S">
-                    match = re.search(r'itemprop="duration" content="PT(\d+H)?(\d+M)?(\d+S)?"', html)
-                    if match:
-                        h = match.group(1)[:-1] if match.group(1) else "0"
-                        m = match.group(2)[:-1] if match.group(2) else "0"
-                        s = match.group(3)[:-1] if match.group(3) else "0"
-                        
-                        if int(h) > 0:
-                            duration = f"{h}:{m.zfill(2)}:{s.zfill(2)}"
-                        else:
-                            duration = f"{m}:{s.zfill(2)}"
-                        
-                        duration_cache[video_id] = duration
-                        save_metadata(video_id, duration)
-                        return duration
-    except: pass
+def get_feed_cache(url):
+    row = db.fetchone("SELECT etag, last_modified, feed_title, entries FROM feed_cache WHERE url = ?", (url,))
+    if not row: return None
+    try: entries = json.loads(row['entries']) if row['entries'] else []
+    except: entries = []
+    return {'etag': row['etag'], 'last_modified': row['last_modified'],
+            'feed': {'title': row['feed_title'], 'entries': entries}}
 
-    # Fallback to yt-dlp
-    try:
-        proc = await asyncio.create_subprocess_exec(
-            "yt-dlp", "--get-duration", video_url,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.DEVNULL
-        )
-        stdout, _ = await proc.communicate()
-        if stdout:
-            duration = stdout.decode().strip()
-            if ':' in duration or duration.isdigit():
-                if duration.isdigit(): duration = f"0:{duration.zfill(2)}"
-                duration_cache[video_id] = duration
-                save_metadata(video_id, duration)
-                return duration
-    except: pass
-    return "??:??"
+def save_feed_cache(url, etag, last_modified, feed):
+    adb.write('''INSERT OR REPLACE INTO feed_cache (url, etag, last_modified, feed_title, entries, fetched_at)
+                 VALUES (?, ?, ?, ?, ?, ?)''',
+              (url, etag, last_modified, feed['title'], json.dumps(feed['entries']), datetime.now().isoformat()))
+
+async def get_video_duration(video_url, video_id):
+    return await resolver.resolve(video_url, video_id)
 
 def load_feeds_from_opml():
     if not os.path.exists(OPML_FILE): return []
@@ -201,11 +350,20 @@ async def resolve_rss_url_async(url):
     except: pass
     return url
 
+def load_feedparser():
+    import feedparser
+    return feedparser
+
+def load_fetcher():
+    from src import fetcher
+    return fetcher
+
 async def add_feed_to_opml_async(url):
     url = await resolve_rss_url_async(url)
     console.print(f"Verifying link: {url} ...", style="dim")
     try:
         loop = asyncio.get_running_loop()
+        feedparser = await import_in_background(load_feedparser)
         d = await loop.run_in_executor(None, lambda: feedparser.parse(url, agent=USER_AGENT))
         
         if not d.feed.get('title') and not d.entries:
@@ -286,18 +444,99 @@ def show_help():
     console.print(Panel(help_text, title="Help"))
     input("Press Enter to continue...")
 
-async def fetch_feed(session, url):
+async def fetch_feed(fetcher, url, cached=None):
+    """Conditional GET through the pooled fetcher. Returns a FetchResult."""
+    headers = {}
+    if cached:
+        if cached['etag']: headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']: headers['If-Modified-Since'] = cached['last_modified']
+    return await fetcher.fetch(url, headers=headers)
+
+async def fetch_and_parse_feed(fetcher, url):
+    """Returns (feed, status). On a 304 the last parsed entries are reused as-is."""
+    cached = await adb.run(get_feed_cache, url)
+    result = await fetch_feed(fetcher, url, cached)
+    if result.status == 'not_modified' and cached:
+        return cached['feed'], 'not_modified'
+    if result.status != 'ok': return None, result.status
     try:
-        async with session.get(url, headers={"User-Agent": USER_AGENT}) as response:
-            if response.status == 200: return await response.text()
-    except: return None
+        if parse_executor is None:
+            feed = parse_feed(result.body)
+        else:
+            # Parse off the event loop; workers return plain entry dicts, cheap to pickle
+            loop = asyncio.get_running_loop()
+            feed = await loop.run_in_executor(parse_executor, parse_feed, result.body)
+    except Exception:
+        return None, 'parse_error'
+    save_feed_cache(url, result.etag, result.last_modified, feed)
+    return feed, 'ok'
 
-async def fetch_and_parse_feed(session, url):
-    xml_data = await fetch_feed(session, url)
-    if not xml_data: return None
-    loop = asyncio.get_running_loop()
-    # Run feedparser in a thread pool to avoid blocking the event loop
-    return await loop.run_in_executor(None, feedparser.parse, xml_data)
+async def refresh_feeds(feeds, on_feed=None, statuses=None):
+    """Fetches every feed and merges the entries into the store. Returns a summary line.
+
+    Normally every feed is stored in one transaction at the end. With
+    on_feed, each feed is stored as soon as it arrives and then
+    on_feed(url, status, feed, new_entries) is called. `statuses`, if
+    given, is filled with each fetched feed's status.
+    """
+    async def fetch_and_store(fetcher, url):
+        feed, status = await fetch_and_parse_feed(fetcher, url)
+        new_entries = await adb.run(store_feed_entries, url, feed) if feed else []
+        on_feed(url, status, feed, new_entries)
+        return feed, status
+
+    try:
+        # aiohttp is the heaviest import; load it off the event loop while the dashboard draws
+        fetcher_module = await import_in_background(load_fetcher)
+        async with fetcher_module.FeedFetcher.from_config(cfg, USER_AGENT) as fetcher:
+            fetch = fetch_and_parse_feed if on_feed is None else fetch_and_store
+            tasks = [fetch(fetcher, url) for url in feeds]
+            results = await asyncio.gather(*tasks)
+    except Exception as e:
+        return f"Refresh failed: {e}"
+
+    def ingest():
+        with db.transaction():
+            for url, (feed, _) in zip(feeds, results):
+                if feed: store_feed_entries(url, feed)
+    if on_feed is None:
+        try: await adb.run(ingest)
+        except sqlite3.Error as e: return f"Refresh failed: {e}"
+    if statuses is not None: statuses.update((url, status) for url, (_, status) in zip(feeds, results))
+
+    counts = {}
+    for _, status in results: counts[status] = counts.get(status, 0) + 1
+    summary = f"Refreshed {len(feeds)} feeds: {counts.get('ok', 0)} updated, {counts.get('not_modified', 0)} unchanged (cached)"
+    failed = [f"{n} {status.replace('_', ' ')}" for status, n in sorted(counts.items()) if status not in ('ok', 'not_modified')]
+    if failed: summary += f", failed: {', '.join(failed)}"
+    return summary
+
+def render_video_label(v):
+    # Format Date
+    if isinstance(v['published'], str):
+        try: dt = datetime.fromisoformat(v['published']).strftime("%m-%d")
+        except: dt = "??"
+    else:
+        try: dt = datetime(*v['published'][:6]).strftime("%m-%d")
+        except: dt = "??"
+
+    # Icons and Styling (Single-width characters for perfect alignment)
+    seen_mark = "*" if not v['is_seen'] else " " # Star for new, space for seen
+    shorts_mark = "S" if v.get('is_shorts') else " "
+    duration = v.get('duration', '??:??')
+    safe_title = clean_title(v['title'])
+    
+    # Channel truncation (16 chars for better fit)
+    channel_name = v['channel'][:16]
+    
+    # Grid Layout: [Status] Date | Dur | Shorts | Channel | Title
+    return f"{seen_mark} {dt} │ {duration:>7} │ {shorts_mark} │ {channel_name:<16} │ {safe_title}"
+
+video_labels = RowCache(render_video_label)
+channel_rows = RowCache(lambda name, count, icon: Choice(value=f"CH:{name}", name=f"{icon}{name} ({count})"))
+
+def video_label(v):
+    return video_labels.get((v['id'], v['is_seen'], bool(v.get('is_shorts')), v.get('duration'), v['title'], v['channel']), v)
 
 async def show_video_menu(videos, playlist_name=None):
     global SHOW_SHORTS
@@ -309,64 +548,37 @@ async def show_video_menu(videos, playlist_name=None):
             await asyncio.sleep(1.5)
             return
 
-    # Metadata fetching logic (unchanged)
+    # Durations for the first 40 rows; anything below goes to the front of the background prefetch
     to_fetch = [v for v in videos[:40] if v['duration'] == "??:??"]
+    durations = await backend.resolve_durations(to_fetch, videos[40:])
     if to_fetch:
-        console.print(f"Fetching metadata for {len(to_fetch)} videos...", style="dim")
-        sem = asyncio.Semaphore(5)
-        async def fetch_and_update(v):
-            async with sem:
-                dur = await get_video_duration(v['link'], v['id'])
-                v['duration'] = dur
-                if dur != "??:??":
-                    try:
-                        parts = dur.split(':')
-                        if len(parts) == 2:
-                            m, s = int(parts[0]), int(parts[1])
-                            if m == 0 or (m == 1 and s == 0): v['is_shorts'] = True
-                    except: pass
-        await asyncio.gather(*(fetch_and_update(v) for v in to_fetch))
+        for v in to_fetch:
+            v['duration'] = durations.get(v['id']) or "??:??"
+            if is_short_duration(parse_duration(v['duration'])): v['is_shorts'] = True
         
         if not SHOW_SHORTS:
             videos = [v for v in videos if not v.get('is_shorts')]
             if not videos: return
 
+    idx = 0
+    index = None
     while True:
         clear_screen()
-        choices = []
-        for i, v in enumerate(videos):
-            # Format Date
-            if isinstance(v['published'], str):
-                try: dt = datetime.fromisoformat(v['published']).strftime("%m-%d")
-                except: dt = "??"
-            else:
-                try: dt = datetime(*v['published'][:6]).strftime("%m-%d")
-                except: dt = "??"
-
-            # Icons and Styling (Single-width characters for perfect alignment)
-            seen_mark = "*" if not v['is_seen'] else " " # Star for new, space for seen
-            shorts_mark = "S" if v.get('is_shorts') else " "
-            duration = v.get('duration', '??:??')
-            safe_title = clean_title(v['title'])
-            
-            # Channel truncation (16 chars for better fit)
-            channel_name = v['channel'][:16]
-            
-            # Grid Layout: [Status] Date | Dur | Shorts | Channel | Title
-            label = f"{seen_mark} {dt} │ {duration:>7} │ {shorts_mark} │ {channel_name:<16} │ {safe_title}"
-            
-            choices.append(Choice(value=i, name=label))
-        
-        if not choices:
+        if not videos:
             console.print("List is empty.", style="yellow")
             break
+        if index is None:
+            index = SearchIndex([f"{v['title']} {v['channel']}" for v in videos])
 
-        choices.append(Choice(value=-1, name="[Go Back]"))
-
+        # Only the rows around the cursor are rendered (and those come from the label cache)
         title_suffix = "(Shorts hidden)" if not SHOW_SHORTS else ""
-        idx = await ui_filter(
+        idx = await ui_paged_filter(
             message=f"Select video {title_suffix}:", 
-            choices=choices,
+            count=len(videos),
+            render=lambda i: video_label(videos[i]),
+            cursor=idx,
+            footer=[Choice(value=-1, name="[Go Back]")],
+            index=index,
             max_height="70%"
         )
 
@@ -410,14 +622,14 @@ async def show_video_menu(videos, playlist_name=None):
                 console.print(f"Error launching: {e}", style="red")
         
         elif action == "watch_later":
-            if add_to_playlist("Watch Later", video):
+            if await backend.run(add_to_playlist, "Watch Later", video):
                 console.print(f"Added to Watch Later.", style="green")
             else:
                 console.print("Failed to add.", style="red")
             await asyncio.sleep(1.0)
 
         elif action == "add_to":
-            playlists = get_all_playlists()
+            playlists = await backend.run(get_all_playlists)
             p_choices = [Choice(p['name'], name=f"   {p['name']}") for p in playlists]
             p_choices.append(Separator(""))
             p_choices.append(Choice("__new__", name="   [+] Create New Playlist"))
@@ -428,8 +640,8 @@ async def show_video_menu(videos, playlist_name=None):
             if p_selection == "__new__":
                 new_name = await ui_text(message="Enter Playlist Name:")
                 if new_name:
-                    if create_playlist(new_name):
-                        if add_to_playlist(new_name, video):
+                    if await backend.run(create_playlist, new_name):
+                        if await backend.run(add_to_playlist, new_name, video):
                             console.print(f"Created and added to: {new_name}", style="green")
                         else:
                             console.print(f"Created {new_name} but failed to add video.", style="yellow")
@@ -437,21 +649,23 @@ async def show_video_menu(videos, playlist_name=None):
                         console.print(f"Could not create playlist '{new_name}'.", style="red")
                 await asyncio.sleep(1.5)
             elif p_selection and p_selection != "__cancel__":
-                if add_to_playlist(p_selection, video):
+                if await backend.run(add_to_playlist, p_selection, video):
                     console.print(f"Added to: {p_selection}", style="green")
                 else:
                     console.print("Failed to add.", style="red")
                 await asyncio.sleep(1.0)
 
         elif action == "browser":
+            import webbrowser
             webbrowser.open(video['link'])
             mark_as_seen(video['id'], video['title'])
             video['is_seen'] = True
         
         elif action == "remove":
-            if remove_from_playlist(playlist_name, video['id']):
+            if await backend.run(remove_from_playlist, playlist_name, video['id']):
                 console.print("Removed.", style="green")
                 del videos[idx]
+                index = None
             else:
                 console.print("Could not remove.", style="red")
             await asyncio.sleep(1.0)
@@ -483,85 +697,264 @@ async def show_settings_menu():
             new_val = not cfg.get_bool('General', 'multi_playlists')
             cfg.set_val('General', 'multi_playlists', new_val)
 
-async def main_async():
-    global duration_cache, SHOW_SHORTS
-    db.connect()
-    duration_cache = get_cached_metadata()
+def get_parse_executor():
+    mode = cfg.get_str('General', 'parse_mode')
+    if mode not in PARSE_MODES: mode = 'thread'
+    try: workers = cfg.get_int('General', 'parse_workers')
+    except ValueError: workers = 0
+    return make_parse_executor(mode, workers)
+
+async def get_upload_times(feed_url):
+    rows = await adb.fetchall("SELECT published_date FROM videos WHERE feed_url = ? ORDER BY published_date DESC LIMIT ?",
+                       (feed_url, FEED_WINDOW))
+    return [r[0] for r in rows]
+
+def get_refresh_scheduler(prefetch=False):
+    """RefreshScheduler over refresh_feeds, plus the store upkeep that follows a refresh.
+
+    Seen-marks and duration rows are pruned once, after the first refresh
+    has put every feed's current window in the store. Durations are
+    prefetched as soon as a refresh lands: with `prefetch` (the daemon,
+    which has no dashboard to order them by) for every stored video,
+    otherwise the refreshed feeds' videos are moved to the front of the
+    queue the dashboard scheduled.
+    """
+    compacted = False
+    async def refresh(urls):
+        nonlocal compacted
+        statuses = {}
+        summary = await refresh_feeds(urls, statuses=statuses)
+        failed = {url for url in urls if statuses.get(url) not in ('ok', 'not_modified')}
+        if not compacted:
+            await adb.run(compact_store, cfg.get_int('General', 'history_retention_days'),
+                          cfg.get_int('General', 'seen_retention_days'))
+            await resolver.evict_stale()
+            compacted = True
+        if prefetch and cfg.get_bool('Refresh', 'prefetch_durations'):
+            by_channel = await adb.run(load_stored_videos, list(scheduler.due))
+            await prefetch_durations(Timeline.from_channels(by_channel, PREFETCH_TOP_N), by_channel, [])
+        elif cfg.get_bool('Refresh', 'prefetch_durations'):
+            by_channel = await adb.run(load_stored_videos, [url for url in urls if url not in failed])
+            prefetcher.promote(list(merge_timelines(by_channel.values())))
+        durations = resolver.summary()
+        if durations: summary += f"; {durations}"
+        return summary, failed
+
+    scheduler = RefreshScheduler(refresh, get_upload_times,
+                                 min_interval=cfg.get_int('Refresh', 'min_poll_minutes') * 60,
+                                 max_interval=cfg.get_int('Refresh', 'max_poll_minutes') * 60,
+                                 auto=cfg.get_bool('Refresh', 'auto_refresh'))
+    return scheduler
+
+async def prefetch_durations(timeline, all_videos_by_channel, recent_channels):
+    """Queues duration lookups in likely viewing order: All Videos top-N, Watch Later, recent channels, the rest."""
+    order = list(timeline)[:PREFETCH_TOP_N]
+    order += await adb.run(get_playlist_videos, "Watch Later")
+    for name in recent_channels:
+        order += all_videos_by_channel.get(name, [])
+    order += merge_timelines(all_videos_by_channel.values())
+    await resolver.warm([v['id'] for v in order if v['duration'] == "??:??"])
+    prefetcher.schedule(order)
+
+async def resolve_durations(videos, later=(), on_lookup=None):
+    """{video id: duration} for `videos` (dicts with 'id' and 'link'), mostly answered by the prefetch cache.
+
+    `later` videos go to the front of the background prefetch. on_lookup(count)
+    is called first if any of them needs a network lookup.
+    """
+    if cfg.get_bool('Refresh', 'prefetch_durations'):
+        prefetcher.promote(later)
+    if not videos: return {}
+    await resolver.warm([v['id'] for v in videos])
+    if on_lookup and any(resolver.needs_lookup(v['id']) for v in videos):
+        on_lookup(len(videos))
+    sem = asyncio.Semaphore(5)
+    async def lookup(v):
+        async with sem:
+            return v['id'], await get_video_duration(v['link'], v['id'])
+    return dict(await asyncio.gather(*(lookup(v) for v in videos)))
+
+# Store helpers a TUI may run on the daemon (by name), through RemoteBackend.run()
+DAEMON_CALLS = {fn.__name__: fn for fn in (
+    load_stored_videos, get_playlist_videos, get_videos_by_length, search_history, get_all_playlists,
+    create_playlist, delete_playlist, add_to_playlist, remove_from_playlist)}
+
+class LocalBackend:
+    """The TUI's data source without a daemon: refreshes, lookups and the database all run in this process."""
+    remote = False
+
+    def __init__(self):
+        self.scheduler = get_refresh_scheduler()
+
+    async def start(self):
+        global parse_executor
+        await adb.run(db.connect)
+        parse_executor = get_parse_executor()
+
+    async def sync(self):
+        pass
+
+    async def run(self, fn, *args):
+        return await adb.run(fn, *args)
+
+    def mark_seen(self, rows):
+        adb.write_many(SEEN_INSERT, rows)
+
+    async def resolve_durations(self, videos, later=()):
+        announce = lambda count: console.print(f"Fetching metadata for {count} videos...", style="dim")
+        return await resolve_durations(videos, later, announce)
+
+    def prefetch(self, timeline, all_videos_by_channel, recent_channels):
+        if cfg.get_bool('Refresh', 'prefetch_durations'):
+            asyncio.ensure_future(prefetch_durations(timeline, all_videos_by_channel, recent_channels))
+
+    async def close(self):
+        self.scheduler.stop()
+
+class RemoteBackend:
+    """The TUI's data source when a daemon is running: a thin client over its socket.
+
+    The daemon owns refreshing, the duration resolver and the database;
+    this process only draws.
+    """
+    remote = True
+
+    def __init__(self, client):
+        self.client = client
+        self.scheduler = RemoteScheduler(client)
+
+    async def start(self):
+        await self.scheduler.sync()
+
+    async def sync(self):
+        await self.scheduler.sync()
+
+    async def run(self, fn, *args):
+        return await self.client.call("run", fn.__name__, args)
+
+    def mark_seen(self, rows):
+        self.client.notify("mark_seen", rows)
+
+    async def resolve_durations(self, videos, later=()):
+        # Only what the resolver needs crosses the socket
+        slim = lambda vs: [{'id': v['id'], 'link': v['link']} for v in vs]
+        return await self.client.call("resolve_durations", slim(videos), slim(later))
+
+    def prefetch(self, timeline, all_videos_by_channel, recent_channels):
+        pass  # The daemon prefetches after each refresh
+
+    async def close(self):
+        await self.client.close()
+
+async def connect_backend(use_daemon=True):
+    """RemoteBackend if a daemon is listening on SOCKET_FILE, otherwise LocalBackend."""
+    client = await DaemonClient.connect(SOCKET_FILE) if use_daemon else None
+    return RemoteBackend(client) if client is not None else LocalBackend()
+
+def daemon_handlers(scheduler):
+    """The daemon's socket API, for RemoteBackend and RemoteScheduler."""
+    async def run(name, args):
+        if name not in DAEMON_CALLS: raise ValueError(f"{name} can't be called over the socket")
+        return await adb.run(DAEMON_CALLS[name], *args)
+
+    async def mark_seen(rows):
+        adb.write_many(SEEN_INSERT, rows)
+
+    async def status():
+        return {'generation': scheduler.generation, 'busy': scheduler.busy,
+                'summary': scheduler.summary, 'refreshed': list(scheduler.refreshed)}
+
+    async def set_feeds(feeds):
+        scheduler.set_feeds(feeds)
+
+    async def refresh():
+        await scheduler.refresh_now()
+        return await status()
+
+    async def durations(videos, later):
+        return await resolve_durations(videos, later)
+
+    return {'run': run, 'mark_seen': mark_seen, 'status': status, 'set_feeds': set_feeds,
+            'refresh': refresh, 'resolve_durations': durations}
+
+async def serve_daemon():
+    """`ytrss.py daemon`: refreshes feeds and resolves durations for every TUI attached over SOCKET_FILE."""
+    global parse_executor
+    if not hasattr(asyncio, 'start_unix_server'):
+        print("The daemon needs Unix domain sockets, which this platform doesn't have.", file=sys.stderr)
+        return 1
+    await adb.run(db.connect)
+    parse_executor = get_parse_executor()
+    scheduler = get_refresh_scheduler(prefetch=True)
+    scheduler.set_feeds(load_feeds_from_opml())
+    server = DaemonServer(SOCKET_FILE, daemon_handlers(scheduler))
+    try:
+        await server.start()
+    except DaemonError as e:
+        print(e, file=sys.stderr)
+        return 1
+    scheduler.start()
+    print(f"ytrss daemon listening on {SOCKET_FILE}", file=sys.stderr)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        scheduler.stop()
+        await server.close()
+    return 0
+
+async def main_async(profile_startup=False, use_daemon=True):
+    global SHOW_SHORTS, backend
+    backend = await connect_backend(use_daemon)
+    await backend.start()
+    startup.mark("daemon connection" if backend.remote else "database connect and migrations")
+    scheduler = backend.scheduler
+    recent_channels = []
     
     while True:
         feeds = load_feeds_from_opml()
-        seen_ids = get_seen_videos()
         
         if not feeds:
             console.print("\nNo channels found.", style="yellow")
-        
-        all_videos_by_channel = {}
-        all_videos_flat = []
 
-        with console.status("[bold green]Fetching feeds...") as status:
-            async with aiohttp.ClientSession() as session:
-                tasks = [fetch_and_parse_feed(session, url) for url in feeds]
-                results = await asyncio.gather(*tasks)
+        # Stale-while-revalidate: draw from the store now, the scheduler merges refreshes in the background
+        scheduler.set_feeds(feeds)
 
-        for d in results:
-            if not d: continue
-            try:
-                ch_name = clean_title(d.feed.get('title', 'Unknown'))
-                ch_videos = []
-                for entry in d.entries:
-                    vid_id = entry.get('id', entry.link)
-                    if vid_id.startswith('yt:video:'): vid_id = vid_id.replace('yt:video:', '')
-                    
-                    title = entry.title
-                    
-                    # Try to find duration in media_group if available
-                    duration = duration_cache.get(vid_id, "??:??")
-                    if duration == "??:??":
-                        # Some RSS parsers/feeds include duration in media_content
-                        media_group = entry.get('media_group', {})
-                        if 'duration' in media_group:
-                            duration = media_group['duration']
-                        elif 'media_content' in entry and len(entry['media_content']) > 0:
-                            if 'duration' in entry['media_content'][0]:
-                                duration = entry['media_content'][0]['duration']
-
-                    is_shorts = "#shorts" in title.lower() or "#shorts" in entry.get('summary', '').lower()
-                    v = {
-                        'id': vid_id, 'title': title, 'link': entry.link,
-                        'published': entry.get('published_parsed'),
-                        'channel': ch_name, 'is_seen': vid_id in seen_ids,
-                        'is_shorts': is_shorts,
-                        'duration': duration
-                    }
-                    if v['duration'] != "??:??":
-                         try:
-                            parts = v['duration'].split(':')
-                            if len(parts) == 2 and (int(parts[0]) == 0 or (int(parts[0]) == 1 and int(parts[1]) == 0)):
-                                v['is_shorts'] = True
-                         except: pass
-                    if v['published']:
-                        ch_videos.append(v)
-                        all_videos_flat.append(v)
-                all_videos_by_channel[ch_name] = ch_videos
-            except: pass
-        
-        all_videos_flat.sort(key=lambda x: x['published'], reverse=True)
+        all_videos_by_channel = await backend.run(load_stored_videos, feeds)
+        timeline = Timeline.from_channels(all_videos_by_channel, ALL_VIDEOS_LIMIT)
+        channel_names = sorted(all_videos_by_channel)
+        built_generation = scheduler.generation
+        startup.mark("stored videos and timeline")
 
         should_refresh = False
         last_selection = None
+        background_started = False
 
         while not should_refresh:
+            await backend.sync()
+            if scheduler.generation != built_generation:
+                urls = scheduler.refreshed_since(built_generation)
+                if urls is None or set(urls) >= set(feeds):
+                    break
+                # Partial refresh: reload just those feeds and merge them into the timeline
+                changed = await backend.run(load_stored_videos, urls)
+                replace_feeds(all_videos_by_channel, changed, urls)
+                if not timeline.merge(merge_timelines(changed.values()), urls):
+                    timeline = Timeline.from_channels(all_videos_by_channel, ALL_VIDEOS_LIMIT)
+                channel_names = sorted(all_videos_by_channel)
+                built_generation = scheduler.generation
             clear_screen()
             
             # Dashboard Statistics
-            unread_total = len([v for v in all_videos_flat if not v['is_seen']])
+            unread_total = sum(1 for videos in all_videos_by_channel.values() for v in videos if not v['is_seen'])
             
             # Playlists data
-            all_playlists = get_all_playlists()
-            playlists_counts = {}
-            for p in all_playlists:
-                p_videos = get_playlist_videos(p['name'])
-                playlists_counts[p['name']] = len(p_videos)
+            all_playlists = await backend.run(get_all_playlists, True)
+            playlists_counts = {p['name']: p['count'] for p in all_playlists}
 
             wl_count = playlists_counts.get("Watch Later", 0)
             shorts_status = "ON" if SHOW_SHORTS else "OFF"
@@ -600,6 +993,7 @@ async def main_async():
                 )
 
             console.print(Panel(stats_text, title=title, border_style=border, expand=False, padding=(0, 1) if not is_newyear else (1, 2)))
+            console.print("Refreshing feeds in the background..." if scheduler.busy else (scheduler.summary or ""), style="dim")
             
             choices = []
             choices.append(Separator(""))
@@ -619,6 +1013,9 @@ async def main_async():
             wl_icon = "   🥂  " if is_newyear else ("   🎁  " if is_christmas else "   📂  ")
             
             choices.append(Choice(value="ALL", name=f"{all_icon}All Videos ({unread_total} new)"))
+            choices.append(Choice(value="search", name="   🔎  Search history"))
+            for key, (label, _, _) in LENGTH_VIEWS.items():
+                choices.append(Choice(value=f"LEN:{key}", name=f"   ⏱   {label}"))
             
             multi_on = cfg.get_bool('General', 'multi_playlists')
             for p in all_playlists:
@@ -646,9 +1043,10 @@ async def main_async():
                 elif is_newyear: ch_icon = "   🔔  "
                 else:            ch_icon = "   📺  "
                 
-                for name in sorted(all_videos_by_channel.keys()):
-                    count = len([v for v in all_videos_by_channel[name] if not v['is_seen']])
-                    choices.append(Choice(value=f"CH:{name}", name=f"{ch_icon}{name} ({count})"))
+                # Rows are cached by what they show, so only channels whose unread count changed are rebuilt
+                for name in channel_names:
+                    count = sum(1 for v in all_videos_by_channel[name] if not v['is_seen'])
+                    choices.append(channel_rows.get((name, count, ch_icon), name, count, ch_icon))
             
             # 3. SYSTEM
             choices.append(Separator(""))
@@ -674,6 +1072,16 @@ async def main_async():
             choices.append(Choice("help",    "   [ ? ] Help"))
             choices.append(Choice("quit",    "   [ Q ] Quit"))
 
+            startup.first_paint()
+            if profile_startup:
+                console.print(startup.report())
+                return
+            if not background_started:
+                # Refreshes and duration prefetches start once the dashboard is up, so they don't slow down drawing it
+                scheduler.start()
+                backend.prefetch(timeline, all_videos_by_channel, recent_channels)
+                background_started = True
+
             selection = await ui_filter(
                 message="YTRSS Main Menu", 
                 choices=choices,
@@ -689,9 +1097,11 @@ async def main_async():
                 await show_settings_menu()
                 continue
             elif selection == "refresh": 
+                with console.status("[bold green]Fetching feeds..."):
+                    await scheduler.refresh_now()
                 should_refresh = True
             elif selection == "del_playlist":
-                playlists = [p for p in get_all_playlists() if not p['is_system']]
+                playlists = [p for p in await backend.run(get_all_playlists) if not p['is_system']]
                 if not playlists:
                     console.print("No custom playlists to delete.", style="yellow")
                     await asyncio.sleep(1.0)
@@ -700,7 +1110,7 @@ async def main_async():
                 p_choices.append(Choice("__cancel__", name="   [x] Cancel"))
                 p_to_del = await ui_select(message="Select Playlist to DELETE:", choices=p_choices)
                 if p_to_del and p_to_del != "__cancel__":
-                    db.execute("DELETE FROM playlists WHERE name = ?", (p_to_del,))
+                    await backend.run(delete_playlist, p_to_del)
                     console.print(f"Playlist '{p_to_del}' deleted.", style="green")
                     await asyncio.sleep(1.0)
             elif selection == "add":
@@ -713,31 +1123,114 @@ async def main_async():
                 await remove_channel_ui()
                 should_refresh = True
             elif selection == "mark":
-                unseen = [v for v in all_videos_flat if not v['is_seen']]
+                unseen = [v for videos in all_videos_by_channel.values() for v in videos if not v['is_seen']]
                 mark_all_as_seen(unseen)
                 await asyncio.sleep(1.5)
                 for v in unseen: v['is_seen'] = True
             elif selection == "ALL":
-                await show_video_menu(all_videos_flat[:60]) # Limit to 60 for perf
+                await show_video_menu(list(timeline))
+            elif selection == "search":
+                query = await ui_text(message="Search all videos:")
+                if query and query.strip():
+                    results = await backend.run(search_history, query)
+                    if results:
+                        await show_video_menu(results)
+                    else:
+                        console.print(f"No videos match '{query.strip()}'.", style="yellow")
+                        await asyncio.sleep(1.5)
+            elif selection.startswith("LEN:"):
+                _, min_seconds, max_seconds = LENGTH_VIEWS[selection.split("LEN:")[1]]
+                await show_video_menu(await backend.run(get_videos_by_length, feeds, min_seconds, max_seconds))
             elif selection == "WL" or selection == "PL:Watch Later":
-                wl_videos = get_playlist_videos("Watch Later")
-                current_seen = get_seen_videos()
-                for v in wl_videos: v['is_seen'] = v['id'] in current_seen
+                wl_videos = await backend.run(get_playlist_videos, "Watch Later")
                 await show_video_menu(wl_videos, playlist_name="Watch Later")
             elif selection.startswith("PL:"):
                 p_name = selection.split("PL:")[1]
-                p_videos = get_playlist_videos(p_name)
-                current_seen = get_seen_videos()
-                for v in p_videos: v['is_seen'] = v['id'] in current_seen
+                p_videos = await backend.run(get_playlist_videos, p_name)
                 await show_video_menu(p_videos, playlist_name=p_name)
             elif selection.startswith("CH:"):
                 name = selection.split("CH:")[1]
-                videos = sorted(all_videos_by_channel[name], key=lambda x: x['published'], reverse=True)
-                await show_video_menu(videos)
+                recent_channels = [name] + [c for c in recent_channels if c != name][:4]
+                await show_video_menu(list(all_videos_by_channel[name]))
+
+def video_record(url, feed, entry):
+    """NDJSON record for a new feed entry."""
+    return {"type": "video", "feed": url, "id": entry['id'], "title": entry['title'],
+            "channel": clean_title(feed['title'] or 'Unknown'), "link": entry['link'],
+            "published": entry['published'], "duration_seconds": parse_duration(entry.get('duration')),
+            "is_shorts": bool(entry['is_shorts'])}
+
+async def refresh_headless(out=None):
+    """`ytrss.py refresh`: one full refresh into the database, without the TUI.
+
+    Streams NDJSON to stdout as each feed is stored: a "video" record per
+    entry that was not in the store yet, then a "feed" record with the
+    feed's status. The summary goes to stderr. Returns the exit status:
+    0 if every feed was fetched (or unchanged), 1 otherwise.
+    """
+    global parse_executor
+    out = out or sys.stdout
+    await adb.run(db.connect)
+    parse_executor = get_parse_executor()
+    feeds = load_feeds_from_opml()
+    statuses = {}
+
+    def on_feed(url, status, feed, new_entries):
+        nonlocal out
+        statuses[url] = status
+        lines = [video_record(url, feed, e) for e in new_entries]
+        lines.append({"type": "feed", "url": url, "status": status, "new": len(new_entries)})
+        try:
+            out.write("".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines))
+            out.flush()
+        except BrokenPipeError:
+            # Reader went away (e.g. piped into head); finish the refresh anyway
+            out = open(os.devnull, "w")
+
+    summary = await refresh_feeds(feeds, on_feed)
+    print(summary, file=sys.stderr)
+    ok = all(statuses.get(url) in ('ok', 'not_modified') for url in feeds)
+    return 0 if ok else 1
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="ytrss", description="YouTube subscriptions through RSS, in the terminal.")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print where startup time goes, up to the first dashboard paint, and exit")
+    parser.add_argument("--no-daemon", action="store_true",
+                        help="run everything in this process even if a daemon is running")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("refresh", help="refresh every feed into the database, print new videos as NDJSON and exit",
+                        description="Refreshes every feed into the database without the TUI (e.g. from cron). "
+                                    "New videos and per-feed statuses are printed as NDJSON as each feed completes; "
+                                    "exits with 1 if any feed failed.")
+    commands.add_parser("daemon", help="keep feeds refreshed in the background and serve every open TUI",
+                        description="Owns feed refreshes, duration lookups and the database, and serves them "
+                                    f"to TUIs over {SOCKET_FILE}. TUIs started while it runs attach to it "
+                                    "instead of refreshing on their own.")
+    return parser.parse_args(argv)
+
+async def run(args):
+    try:
+        if args.command == "refresh":
+            return await refresh_headless()
+        if args.command == "daemon":
+            return await serve_daemon()
+        await main_async(profile_startup=args.profile_startup, use_daemon=not args.no_daemon)
+    finally:
+        if backend is not None: await backend.close()
+        if parse_executor is not None: parse_executor.shutdown(cancel_futures=True)
+        prefetcher.stop()
+        await resolver.close()
+        await adb.close()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # parse_mode = process in the PyInstaller build
+    args = parse_args()
     try:
-        asyncio.run(main_async())
+        sys.exit(asyncio.run(run(args)))
     except KeyboardInterrupt:
-        clear_screen()
-        pass
\ No newline at end of file
+        if args.command is None: clear_screen()
+        pass
+    except DaemonError as e:
+        console.print(f"{e}. Restart ytrss (or the daemon).", style="red")
+        sys.exit(1)
\ No newline at end of file